@@ -7,66 +7,195 @@ Fixes the issues identified:
 - Agent-to-agent communication (from real_ai_agents.py)
 - Single clean registration
 - Rate limiting and error handling
+
+Requires python-socketio, orjson and httpx, ideally with HTTP/2 support:
+    pip install python-socketio orjson "httpx[http2]"
+Without the http2 extra the API calls go over HTTP/1.1; without httpx every
+API call uses its fallback reply.
 """
 
 import asyncio
-import socketio
-import aiohttp
+import importlib.util
 import json
+import logging
+import orjson
 import os
+import re
 import time
-from datetime import datetime
-from typing import Optional, List
+from collections import deque
+from typing import TYPE_CHECKING, Optional, List
+
+from demo_common import AgentBus, OrjsonModule, iso_timestamp_micros, setup_logging, stop_on_sigint
+
+# socketio and httpx are imported where first used to keep startup fast
+if TYPE_CHECKING:
+    import httpx
+
+PHASE_FIELDS = ("analysis", "plan", "implementation", "completion")
+# Pulls a field's JSON string value out of a reply whose JSON is wrapped or broken
+PHASE_FIELD_RES = {field: re.compile(rf'"{field}"\s*:\s*"((?:[^"\\]|\\.)*)"') for field in PHASE_FIELDS}
+# Status broadcasts that never warrant a reply unless they @mention the agent
+SILENT_PREFIXES = ("Starting work on", "Analysis complete", "Work plan ready", "Implementation progress", "Task completed")
+BROADCAST_WINDOW = 0.5  # seconds to collect agent messages before emitting them together
+# Seconds before each phase report: the first runs alongside the PHASES call, the rest space out the later phases
+PHASE_PACING = (2, 2, 3, 2)
+
+logger = logging.getLogger("act.demo")
+
+class TokenBucket:
+    """Async token bucket allowing short bursts up to capacity, refilled at a steady rate"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    async def acquire(self, n: float = 1):
+        async with self._lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= n
+
+# Outbound LLM requests in flight at once across the whole process; the rest queue here
+MAX_CONCURRENT_LLM_REQUESTS = 4
+_LLM_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_LLM_REQUESTS)
+
+# One HTTP/2 client for the whole process; concurrent calls multiplex over a single connection
+_http_client: Optional["httpx.AsyncClient"] = None
+# httpx's timeout exception, filled in by get_http_client; nothing can time out before the client exists
+_http_timeout_errors: tuple = ()
+
+def get_http_client() -> "httpx.AsyncClient":
+    """Lazily create the process-wide OpenRouter client, on HTTP/2 when the h2 package is installed"""
+    global _http_client, _http_timeout_errors
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        http2 = importlib.util.find_spec("h2") is not None
+        if not http2:
+            logger.info("🔧 h2 not installed, API calls use HTTP/1.1 (pip install \"httpx[http2]\")")
+        _http_timeout_errors = (httpx.TimeoutException,)
+        _http_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        )
+    return _http_client
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# One bucket per API key: bursts of 5 calls, then one call every 3 seconds
+_RATE_LIMITERS: dict = {}
+
+def get_rate_limiter(api_key: Optional[str]) -> TokenBucket:
+    bucket = _RATE_LIMITERS.get(api_key)
+    if bucket is None:
+        bucket = _RATE_LIMITERS[api_key] = TokenBucket(capacity=5, refill_rate=1 / 3)
+    return bucket
 
 class CommunicatingAIAgent:
-    def __init__(self, agent_id: str, name: str, capabilities: List[str], model: str, personality: str, color: str = "🤖"):
+    __slots__ = (
+        'agent_id', 'name', 'capabilities', '_cap_str', '_cap0', 'model', 'personality', 'color',
+        'bus', 'sio', 'tasks_completed', '_stop_event', 'is_registered', 'api_key', '_headers', '_system_msg',
+        '_progress_base', '_cache', '_cache_order', '_msg_buf', '_flush_task',
+        '_fb_rate_limited', '_fb_model_missing', '_fb_offline', '_fb_timeout', '_fb_error', '_fb_phases',
+        '_log_rate_limited', '_log_model_missing', '_log_timeout'
+    )
+
+    # Running total across every agent, so reporting never has to re-sum
+    total_tasks_completed = 0
+
+    # Prompt templates, filled in with str.format at the call site
+    PHASES_TMPL = (
+        'Task: "{description}"\\n\\nAs a {cap} expert, respond with strict JSON only: '
+        '{{"analysis": "...", "plan": "...", "implementation": "...", "completion": "..."}} '
+        'where analysis is a 1-sentence analysis of the task, plan is a brief 1-sentence work plan, '
+        'implementation briefly describes what you would implement, and completion summarizes what you completed (1 sentence).'
+    )
+    RESPONSE_TMPL = (
+        'Another AI agent "{sender}" sent you this message: "{message}"\\n\\nYou are {name} with personality: {personality}\\n\\n'
+        'Should you respond to this message? If yes, provide a brief, helpful response. If no response needed, just say "NO_RESPONSE".'
+    )
+
+    def __init__(self, agent_id: str, name: str, capabilities: List[str], model: str, personality: str, color: str = "🤖", bus: Optional[AgentBus] = None):
         self.agent_id = agent_id
         self.name = name
-        self.capabilities = capabilities
+        self.capabilities = tuple(capabilities)
+        self._cap_str = ', '.join(self.capabilities)
+        self._cap0 = self.capabilities[0]
         self.model = model
         self.personality = personality
         self.color = color
-        self.sio = socketio.AsyncClient()
+        self.bus = bus if bus is not None else AgentBus()
+        self.sio = self.bus.sio
         self.tasks_completed = 0
-        self.is_running = True
+        self._stop_event = asyncio.Event()
         self.is_registered = False
         self.api_key = os.getenv('OPENROUTER_API_KEY')
 
-        # Rate limiting
-        self.last_api_call = 0
-        self.min_api_interval = 3  # 3 seconds between API calls
-        self.setup_event_handlers()
-
-    def setup_event_handlers(self):
-        @self.sio.event
-        async def connect():
-            if not self.is_registered:
-                print(f"✅ {self.name} ({self.model}) connected!")
-                await self.register_agent()
-                self.is_registered = True
-
-        @self.sio.event
-        async def agent_registered(data):
-            if not self.is_registered:
-                print(f"🎯 {self.name} registered successfully")
-                self.is_registered = True
-
-                # Send introduction to other agents
-                intro = await self.generate_introduction()
-                await self.broadcast_message(f"Hello team! {intro}")
-
-        @self.sio.event
-        async def task_assigned(data):
-            await self.handle_task_assignment(data)
-
-        @self.sio.event
-        async def task_created(data):
-            task_desc = data.get('task', {}).get('description', 'Unknown')
-            print(f"📝 {self.name} sees new task: {task_desc[:60]}...")
-
-        @self.sio.event
-        async def agent_message(data):
-            await self.handle_agent_communication(data)
+        # Request pieces that never change for the lifetime of the agent
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._system_msg = {"role": "system", "content": f"You are {self.name}. {self.personality} Be concise and practical."}
+        self._progress_base = {'agentId': self.agent_id}
+
+        # Fallback responses and log lines for the API error paths, built once
+        self._fb_rate_limited = f"[{self.name} processing - rate limited but working on task]"
+        self._fb_model_missing = f"[{self.name} using built-in {self._cap0} expertise]"
+        self._fb_offline = f"[{self.name} working with offline capabilities]"
+        self._fb_timeout = f"[{self.name} processing with local expertise]"
+        self._fb_error = f"[{self.name} working with {self._cap0} capabilities]"
+        self._fb_phases = {
+            "analysis": f"[{self.name} analyzing with built-in {self._cap0} expertise]",
+            "plan": f"[{self.name} planning from {self._cap0} experience]",
+            "implementation": f"[{self.name} implementing with {self._cap0} capabilities]",
+            "completion": f"[{self.name} finished the task with {self._cap0} capabilities]"
+        }
+        self._log_rate_limited = f"⏳ {self.name} hit rate limit, using fallback response"
+        self._log_model_missing = f"❌ {self.name} model not available, using capability-based response"
+        self._log_timeout = f"⏱️ {self.name} API timeout, using fallback"
+
+        # Successful responses keyed on (model, system, prompt, max_tokens), oldest evicted first
+        self._cache: dict[tuple, str] = {}
+        self._cache_order: deque = deque(maxlen=256)
+
+        # Outgoing agent messages waiting for the next coalesced emit
+        self._msg_buf: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    # Socket.IO events are dispatched to these by the AgentBus
+    async def on_connect(self):
+        if not self.is_registered:
+            logger.info(f"✅ {self.name} ({self.model}) connected!")
+            await self.register_agent()
+            self.is_registered = True
+
+    async def on_agent_registered(self, data):
+        if not self.is_registered:
+            logger.info(f"🎯 {self.name} registered successfully")
+            self.is_registered = True
+
+            # Send introduction to other agents
+            intro = await self.generate_introduction()
+            await self.broadcast_message(f"Hello team! {intro}")
+
+    async def on_task_created(self, data):
+        task_desc = data.get('task', {}).get('description', 'Unknown')
+        logger.info(f"📝 {self.name} sees new task: {task_desc[:60]}...")
 
     async def register_agent(self):
         """Register once only"""
@@ -81,7 +210,7 @@ class CommunicatingAIAgent:
 
     async def generate_introduction(self) -> str:
         """Generate AI-powered introduction"""
-        prompt = f"You are {self.name}, an AI agent with these capabilities: {', '.join(self.capabilities)}. Your personality: {self.personality}. Generate a brief, friendly introduction (1-2 sentences) to other AI agents you'll be working with. Be professional but show your personality."
+        prompt = f"You are {self.name}, an AI agent with these capabilities: {self._cap_str}. Your personality: {self.personality}. Generate a brief, friendly introduction (1-2 sentences) to other AI agents you'll be working with. Be professional but show your personality."
 
         response = await self.rate_limited_api_call(prompt, 100)
         return response.strip()
@@ -89,57 +218,91 @@ class CommunicatingAIAgent:
     async def rate_limited_api_call(self, prompt: str, max_tokens: int = 150) -> str:
         """API call with proper rate limiting and error handling"""
 
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_call
-        if time_since_last < self.min_api_interval:
-            wait_time = self.min_api_interval - time_since_last
-            await asyncio.sleep(wait_time)
+        # Identical prompts are answered from the cache without touching the rate limit
+        key = (self.model, self._system_msg["content"], prompt, max_tokens)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        # Rate limiting shared by every agent using the same API key
+        await get_rate_limiter(self.api_key).acquire()
 
         data = {
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": f"You are {self.name}. {self.personality} Be concise and practical."},
-                {"role": "user", "content": prompt}
-            ],
+            "messages": (self._system_msg, {"role": "user", "content": prompt}),
             "max_tokens": max_tokens,
             "temperature": 0.7
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
+            client = get_http_client()
+            async with _LLM_SEMAPHORE:
+                response = await client.post(
                     "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    self.last_api_call = time.time()
-
-                    if response.status == 200:
-                        result = await response.json()
-                        return result["choices"][0]["message"]["content"].strip()
-                    elif response.status == 429:  # Rate limited
-                        print(f"⏳ {self.name} hit rate limit, using fallback response")
-                        return f"[{self.name} processing - rate limited but working on task]"
-                    elif response.status == 404:  # Model not available
-                        print(f"❌ {self.name} model not available, using capability-based response")
-                        return f"[{self.name} using built-in {self.capabilities[0]} expertise]"
-                    else:
-                        print(f"⚠️ {self.name} API error {response.status}, using fallback")
-                        return f"[{self.name} working with offline capabilities]"
-
-        except asyncio.TimeoutError:
-            print(f"⏱️ {self.name} API timeout, using fallback")
-            return f"[{self.name} processing with local expertise]"
+                    headers=self._headers,
+                    content=orjson.dumps(data)
+                )
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                content = result["choices"][0]["message"]["content"]
+                content = content.strip() if content else ""
+                self._cache_response(key, content)
+                return content
+            elif response.status_code == 429:  # Rate limited
+                logger.info(self._log_rate_limited)
+                return self._fb_rate_limited
+            elif response.status_code == 404:  # Model not available
+                logger.info(self._log_model_missing)
+                return self._fb_model_missing
+            else:
+                logger.info(f"⚠️ {self.name} API error {response.status_code}, using fallback")
+                return self._fb_offline
+
+        except ImportError as e:  # httpx is not installed
+            logger.info(f"🔧 {self.name} needs httpx for API calls, using fallback: {str(e)[:50]}")
+            return self._fb_error
+        except _http_timeout_errors:
+            logger.info(self._log_timeout)
+            return self._fb_timeout
         except Exception as e:
-            print(f"🔧 {self.name} API error, using fallback: {str(e)[:50]}")
-            return f"[{self.name} working with {self.capabilities[0]} capabilities]"
+            logger.info(f"🔧 {self.name} API error, using fallback: {str(e)[:50]}")
+            return self._fb_error
+
+    def _cache_response(self, key: tuple, content: str):
+        """Store a successful response, evicting the oldest entry when full"""
+        if key in self._cache:
+            return
+        if len(self._cache_order) == self._cache_order.maxlen:
+            self._cache.pop(self._cache_order.popleft(), None)
+        self._cache_order.append(key)
+        self._cache[key] = content
+
+    def parse_phases(self, response: str) -> dict:
+        """Split a batched phase response into its four fields
+
+        Falls back to regex extraction when the model wraps or breaks the JSON,
+        and to the agent's short default for any field that cannot be recovered.
+        """
+        try:
+            parsed = json.loads(response[response.index("{"):response.rindex("}") + 1])
+        except ValueError:
+            parsed = {}
+        if not isinstance(parsed, dict):
+            parsed = {}
+
+        phases = {}
+        for field in PHASE_FIELDS:
+            value = parsed.get(field)
+            if not isinstance(value, str):
+                match = PHASE_FIELD_RES[field].search(response)
+                try:
+                    # The capture is still JSON-escaped (\" and \n)
+                    value = json.loads(f'"{match.group(1)}"') if match else ""
+                except ValueError:
+                    value = ""
+            phases[field] = value.strip() or self._fb_phases[field]
+        return phases
 
     async def handle_task_assignment(self, data):
         """Handle real task assignment with proper error handling"""
@@ -150,140 +313,175 @@ class CommunicatingAIAgent:
         task_id = task.get('id')
         description = task.get('description')
 
-        print(f"\\n{self.color} {self.name} ASSIGNED TASK: {description}")
-        print(f"📋 Task ID: {task_id}")
-
-        # Announce to other agents
-        await self.broadcast_message(f"Starting work on: {description}")
+        logger.info(f"\\n{self.color} {self.name} ASSIGNED TASK: {description}")
+        logger.info(f"📋 Task ID: {task_id}")
 
         try:
-            # Phase 1: Analysis
-            print(f"🔍 {self.name} analyzing task...")
-            analysis_prompt = f'Task: "{description}"\\n\\nAs a {self.capabilities[0]} expert, provide a 1-sentence analysis of this task.'
-
-            analysis = await self.rate_limited_api_call(analysis_prompt, 100)
-            print(f"💭 {self.name}: {analysis}")
+            # All four phases come back from a single API call
+            logger.info(f"🔍 {self.name} analyzing task...")
+            phases_prompt = self.PHASES_TMPL.format(description=description, cap=self._cap0)
+
+            # Announce to other agents; this only queues the message, so it doesn't delay the call
+            await self.broadcast_message(f"Starting work on: {description}")
+            reply, _ = await asyncio.gather(
+                self.rate_limited_api_call(phases_prompt, 400),
+                asyncio.sleep(PHASE_PACING[0])
+            )
+            phases = self.parse_phases(reply)
+            analysis = phases["analysis"]
+            logger.info(f"💭 {self.name}: {analysis}")
             await self.broadcast_message(f"Analysis complete: {analysis[:60]}...")
 
             await self.sio.emit('update_task_progress', {
+                **self._progress_base,
                 'taskId': task_id,
                 'progress': 25,
-                'agentId': self.agent_id,
                 'status': 'Analysis complete'
             })
 
             # Phase 2: Planning
-            await asyncio.sleep(2)
-            print(f"📋 {self.name} creating work plan...")
-            plan_prompt = f'For task "{description}", provide a brief 1-sentence work plan.'
-
-            plan = await self.rate_limited_api_call(plan_prompt, 100)
-            print(f"📝 {self.name}: {plan}")
+            await asyncio.sleep(PHASE_PACING[1])
+            logger.info(f"📋 {self.name} creating work plan...")
+            plan = phases["plan"]
+            logger.info(f"📝 {self.name}: {plan}")
             await self.broadcast_message(f"Work plan ready: {plan[:60]}...")
 
             await self.sio.emit('update_task_progress', {
+                **self._progress_base,
                 'taskId': task_id,
                 'progress': 50,
-                'agentId': self.agent_id,
                 'status': 'Planning complete'
             })
 
             # Phase 3: Implementation
-            await asyncio.sleep(3)
-            print(f"⚡ {self.name} implementing solution...")
-            impl_prompt = f'Briefly describe what you would implement for: "{description}"'
-
-            implementation = await self.rate_limited_api_call(impl_prompt, 120)
-            print(f"🔧 {self.name}: {implementation}")
+            await asyncio.sleep(PHASE_PACING[2])
+            logger.info(f"⚡ {self.name} implementing solution...")
+            implementation = phases["implementation"]
+            logger.info(f"🔧 {self.name}: {implementation}")
             await self.broadcast_message(f"Implementation progress: {implementation[:60]}...")
 
             await self.sio.emit('update_task_progress', {
+                **self._progress_base,
                 'taskId': task_id,
                 'progress': 75,
-                'agentId': self.agent_id,
                 'status': 'Implementation in progress'
             })
 
             # Phase 4: Completion
-            await asyncio.sleep(2)
-            print(f"🎯 {self.name} finalizing work...")
-            completion_prompt = f'Summarize what you completed for task: "{description}" (1 sentence)'
-
-            completion = await self.rate_limited_api_call(completion_prompt, 100)
+            await asyncio.sleep(PHASE_PACING[3])
+            logger.info(f"🎯 {self.name} finalizing work...")
+            completion = phases["completion"]
 
             await self.sio.emit('update_task_progress', {
+                **self._progress_base,
                 'taskId': task_id,
                 'progress': 100,
-                'agentId': self.agent_id,
                 'status': 'Task completed'
             })
 
             self.tasks_completed += 1
-            print(f"✅ {self.name} COMPLETED TASK!")
-            print(f"🎉 Result: {completion}")
-            print(f"📊 Total tasks completed: {self.tasks_completed}")
+            CommunicatingAIAgent.total_tasks_completed += 1
+            logger.info(f"✅ {self.name} COMPLETED TASK!")
+            logger.info(f"🎉 Result: {completion}")
+            logger.info(f"📊 Total tasks completed: {self.tasks_completed}")
 
             # Share completion with other agents
             await self.broadcast_message(f"Task completed! {completion}")
 
         except Exception as e:
-            print(f"❌ {self.name} task error: {str(e)[:50]}... Reporting failure")
+            logger.info(f"❌ {self.name} task error: {str(e)[:50]}... Reporting failure")
             await self.sio.emit('update_task_progress', {
+                **self._progress_base,
                 'taskId': task_id,
                 'progress': 0,
-                'agentId': self.agent_id,
                 'status': f'Task failed: {str(e)[:30]}'
             })
 
+    def may_need_reply(self, message: str) -> bool:
+        """Cheap prefilter deciding whether a peer message is worth an LLM call"""
+        if f"@{self.name}" in message:
+            return True
+        if all(line.startswith(SILENT_PREFIXES) for line in message.splitlines()):
+            return False
+        return self.name in message or "?" in message
+
     async def handle_agent_communication(self, data):
         """Handle messages from other AI agents"""
         sender = data.get('sender')
         message = data.get('message')
+        if isinstance(message, list):
+            message = "\n".join(message)
 
+        # A coalesced batch gets a single response decision, not one per line
         if sender != self.name:
-            print(f"💬 {self.name} received from {sender}: {message}")
+            logger.info(f"💬 {self.name} received from {sender}: {message}")
+
+            # Skip the LLM entirely for status chatter not addressed to this agent
+            if not self.may_need_reply(message):
+                return
 
             # AI decides whether and how to respond
-            response_prompt = f'Another AI agent "{sender}" sent you this message: "{message}"\\n\\nYou are {self.name} with personality: {self.personality}\\n\\nShould you respond to this message? If yes, provide a brief, helpful response. If no response needed, just say "NO_RESPONSE".'
+            response_prompt = self.RESPONSE_TMPL.format(sender=sender, message=message, name=self.name, personality=self.personality)
 
             response = await self.rate_limited_api_call(response_prompt, 80)
 
+            # Pacing comes from the shared token bucket, so reply straight away
             if response.strip() != "NO_RESPONSE":
-                await asyncio.sleep(1)  # Brief pause before responding
                 await self.broadcast_message(f"@{sender} {response}")
 
     async def broadcast_message(self, message: str):
-        """Send message to other agents"""
-        await self.sio.emit('agent_message', {
+        """Queue a message for other agents; messages sent close together go out as one emit"""
+        self._msg_buf.append(message)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(BROADCAST_WINDOW))
+
+    async def _flush_after(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush_messages()
+
+    async def flush_messages(self):
+        """Emit everything buffered so far as a single newline-joined agent_message"""
+        if not self._msg_buf:
+            return
+        message = "\n".join(self._msg_buf)
+        self._msg_buf.clear()
+        await self.bus.broadcast(self, {
             'sender': self.name,
             'message': message,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso_timestamp_micros()
         })
 
     async def start(self):
         """Start the agent with proper error handling"""
-        print(f"{self.color} {self.name} initializing...")
+        logger.info(f"{self.color} {self.name} initializing...")
 
         try:
-            await self.sio.connect('http://localhost:8080')
-            print(f"🧠 {self.name} ready for coordination!")
+            await self.bus.attach(self)
+            logger.info(f"🧠 {self.name} ready for coordination!")
 
-            while self.is_running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
 
         except Exception as e:
-            print(f"❌ {self.name} connection error: {e}")
+            logger.info(f"❌ {self.name} connection error: {e}")
         finally:
-            await self.sio.disconnect()
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            if self.sio.connected:
+                await self.flush_messages()
+            await self.bus.detach(self)
 
-    async def stop(self):
-        self.is_running = False
+    def stop(self):
+        """Stop the agent; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 class CommunicatingTaskCreator:
     """Creates tasks for communicating agents"""
 
     def __init__(self):
-        self.sio = socketio.AsyncClient()
+        import socketio
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
         self.tasks = [
             ("Create a user dashboard wireframe", ["design", "frontend"]),
             ("Write API documentation for user endpoints", ["documentation", "backend"]),
@@ -295,8 +493,8 @@ class CommunicatingTaskCreator:
         await self.sio.connect('http://localhost:8080')
         await asyncio.sleep(8)  # Let agents register and introduce themselves
 
-        print("\\n📋 CREATING TASKS FOR COMMUNICATING AGENTS")
-        print("=" * 50)
+        logger.info("\\n📋 CREATING TASKS FOR COMMUNICATING AGENTS")
+        logger.info("=" * 50)
 
         for i, (description, capabilities) in enumerate(self.tasks):
             await asyncio.sleep(15)  # Proper spacing between tasks
@@ -307,43 +505,50 @@ class CommunicatingTaskCreator:
                 'priority': 'medium'
             })
 
-            print(f"📝 Created task {i+1}/4: {description}")
-            print(f"🎯 Required capabilities: {capabilities}")
+            logger.info(f"📝 Created task {i+1}/4: {description}")
+            logger.info(f"🎯 Required capabilities: {capabilities}")
 
-        print("\\n🎉 All tasks created! Watch agents communicate and coordinate...")
+        logger.info("\\n🎉 All tasks created! Watch agents communicate and coordinate...")
         await self.sio.disconnect()
 
 async def main():
-    print("🚀 COMMUNICATING AI AGENT COORDINATION DEMO")
-    print("=" * 60)
-    print("🧠 Real AI agents with task completion AND communication")
-    print("💬 Watch agents introduce themselves and collaborate")
-    print("🔥 Press Ctrl+C to stop\\n")
+    logger.info("🚀 COMMUNICATING AI AGENT COORDINATION DEMO")
+    logger.info("=" * 60)
+    logger.info("🧠 Real AI agents with task completion AND communication")
+    logger.info("💬 Watch agents introduce themselves and collaborate")
+    logger.info("🔥 Press Ctrl+C to stop\\n")
 
     if not os.getenv('OPENROUTER_API_KEY'):
-        print("❌ Please set OPENROUTER_API_KEY environment variable")
+        logger.info("❌ Please set OPENROUTER_API_KEY environment variable")
         return
 
-    # Create 2 communicating AI agents
+    # Create 2 communicating AI agents sharing one Socket.IO connection
+    bus = AgentBus()
     agents = [
         CommunicatingAIAgent(
             "designer", "Alex", ["design", "frontend", "ux"],
             "mistralai/mistral-7b-instruct:free",
             "Creative designer focused on user experience and clean interfaces",
-            "🎨"
+            "🎨", bus=bus
         ),
         CommunicatingAIAgent(
             "analyst", "Morgan", ["analysis", "research", "documentation"],
             "google/gemma-2-9b-it:free",
             "Analytical thinker who loves data insights and clear documentation",
-            "📊"
+            "📊", bus=bus
         )
     ]
 
     task_creator = CommunicatingTaskCreator()
 
+    def stop_all():
+        logger.info("\\n\\n🛑 Stopping coordination...")
+        task_generation.cancel()  # no-op once the tasks are created
+        for agent in agents:
+            agent.stop()
+
     try:
-        print("🔗 Starting communicating AI agents...")
+        logger.info("🔗 Starting communicating AI agents...")
 
         # Start agents
         agent_tasks = [asyncio.create_task(agent.start()) for agent in agents]
@@ -351,27 +556,35 @@ async def main():
         # Create tasks with proper timing
         task_generation = asyncio.create_task(task_creator.create_tasks())
 
-        # Run coordination
-        await asyncio.gather(*agent_tasks, task_generation)
+        # Ctrl+C wakes every agent at once instead of interrupting the loop
+        stop_on_sigint(stop_all)
 
-    except KeyboardInterrupt:
-        print("\\n\\n🛑 Stopping coordination...")
+        # Run coordination; the cancelled task generator is collected instead of raised
+        await asyncio.gather(*agent_tasks, task_generation, return_exceptions=True)
 
-        for agent in agents:
-            await agent.stop()
+    except KeyboardInterrupt:
+        logger.info("\\n\\n🛑 Stopping coordination...")
 
-        print("\\n🎯 COMMUNICATING AI COORDINATION RESULTS:")
-        print("=" * 50)
-        total_completed = 0
         for agent in agents:
-            print(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
-            total_completed += agent.tasks_completed
-
-        if total_completed > 0:
-            print(f"\\n🎉 SUCCESS: {total_completed} tasks completed with agent communication!")
-            print("💡 Real AI agents coordinated, communicated, and delivered results!")
-        else:
-            print("\\n📝 Agents connected and communicated but didn't complete tasks - check API access")
+            agent.stop()
+    finally:
+        await close_http_client()
+
+    logger.info("\\n🎯 COMMUNICATING AI COORDINATION RESULTS:")
+    logger.info("=" * 50)
+    for agent in agents:
+        logger.info(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
+    total_completed = CommunicatingAIAgent.total_tasks_completed
+
+    if total_completed > 0:
+        logger.info(f"\\n🎉 SUCCESS: {total_completed} tasks completed with agent communication!")
+        logger.info("💡 Real AI agents coordinated, communicated, and delivered results!")
+    else:
+        logger.info("\\n📝 Agents connected and communicated but didn't complete tasks - check API access")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Shared helpers for the example agents
+
+Logging, Socket.IO and OpenRouter plumbing, and event-loop setup used by
+the demo scripts in this directory.
+"""
+
+import asyncio
+import logging
+import logging.handlers
+import queue
+import random
+import signal
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict
+
+import orjson
+
+if TYPE_CHECKING:
+    import aiohttp
+
+uvloop = None
+if sys.platform != "win32":  # uvloop is POSIX-only
+    try:
+        import uvloop  # optional, faster event loop
+    except ImportError:
+        pass
+
+def setup_logging(logger: logging.Logger) -> logging.handlers.QueueListener:
+    """Route logger's output through a queue so the event loop never blocks on stdout writes
+
+    The returned listener owns the stdout handler on its own thread; stop it
+    on exit to flush whatever is still queued.
+    """
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+class OrjsonModule:
+    """json-module shim so socket.io packets are encoded and decoded with orjson"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+class AgentBus:
+    """One Socket.IO connection shared by every agent in the process
+
+    Agents provide agent_id and the coroutines on_connect(), on_agent_registered(data)
+    and handle_task_assignment(data); those events are routed by agentId. Broadcast
+    events go to every agent that defines on_agent_joined, on_task_created or
+    handle_agent_communication. The server never echoes agent_message back to the
+    sending socket, so broadcasts are also delivered locally to the other agents on the bus.
+    """
+
+    def __init__(self, url: str = 'http://localhost:8080'):
+        import socketio  # imported here so scripts that only need the other helpers load without it
+        self.url = url
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
+        self.agents: Dict[str, Any] = {}
+        self._connect_lock = asyncio.Lock()
+        self._local_deliveries: set = set()
+
+        self.sio.on('connect', self._on_connect)
+        self.sio.on('agent_registered', self._on_agent_registered)
+        self.sio.on('task_assigned', self._on_task_assigned)
+        self.sio.on('agent_joined', self._on_agent_joined)
+        self.sio.on('task_created', self._on_task_created)
+        self.sio.on('agent_message', self._on_agent_message)
+
+    async def attach(self, agent):
+        """Add an agent, connecting the shared client on first use"""
+        async with self._connect_lock:
+            self.agents[agent.agent_id] = agent
+            if not self.sio.connected:
+                # The connect event registers every attached agent
+                await self.sio.connect(self.url)
+                return
+        await agent.on_connect()
+
+    async def detach(self, agent):
+        """Remove an agent, disconnecting once the last one has left"""
+        self.agents.pop(agent.agent_id, None)
+        if not self.agents:
+            await self.sio.disconnect()
+
+    async def broadcast(self, sender, payload: dict):
+        await self.sio.emit('agent_message', payload)
+        for agent in self.agents.values():
+            if agent is not sender and hasattr(agent, 'handle_agent_communication'):
+                delivery = asyncio.create_task(agent.handle_agent_communication(payload))
+                self._local_deliveries.add(delivery)
+                delivery.add_done_callback(self._local_deliveries.discard)
+
+    async def _fan_out(self, hook: str, data):
+        """Pass a broadcast event to every agent that handles it"""
+        handlers = [getattr(agent, hook) for agent in list(self.agents.values()) if hasattr(agent, hook)]
+        if handlers:
+            await asyncio.gather(*(handler(data) for handler in handlers))
+
+    async def _on_connect(self):
+        await asyncio.gather(*(agent.on_connect() for agent in list(self.agents.values())))
+
+    async def _on_agent_registered(self, data):
+        agent = self.agents.get(data.get('agentId'))
+        if agent is not None:
+            await agent.on_agent_registered(data)
+
+    async def _on_task_assigned(self, data):
+        agent = self.agents.get(data.get('agentId'))
+        if agent is not None:
+            await agent.handle_task_assignment(data)
+
+    async def _on_agent_joined(self, data):
+        await self._fan_out('on_agent_joined', data)
+
+    async def _on_task_created(self, data):
+        await self._fan_out('on_task_created', data)
+
+    async def _on_agent_message(self, data):
+        await self._fan_out('handle_agent_communication', data)
+
+class EmitTracker:
+    """Fire-and-forget Socket.IO emits that shutdown can still wait for"""
+
+    def __init__(self, sio):
+        self.sio = sio
+        self._pending: set = set()
+
+    def emit(self, event: str, payload: dict):
+        self.track(self.sio.emit(event, payload))
+
+    def track(self, coro):
+        """Run coro as a task, holding a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self):
+        """Wait for everything still in flight; failed emits are dropped"""
+        await asyncio.gather(*self._pending, return_exceptions=True)
+
+def new_openrouter_session() -> "aiohttp.ClientSession":
+    """HTTP session with a keep-alive connection pool for OpenRouter calls"""
+    import aiohttp  # imported here so scripts that only need the other helpers load without it
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=60)
+    )
+
+# At most this many in-flight OpenRouter requests per model, shared by every agent in the process
+MAX_REQUESTS_PER_MODEL = 5
+MAX_RETRIES = 4
+RETRY_STATUSES = (429, 503)
+_MODEL_SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+
+def model_semaphore(model: str) -> asyncio.Semaphore:
+    semaphore = _MODEL_SEMAPHORES.get(model)
+    if semaphore is None:
+        semaphore = _MODEL_SEMAPHORES[model] = asyncio.Semaphore(MAX_REQUESTS_PER_MODEL)
+    return semaphore
+
+def retry_delay(response: "aiohttp.ClientResponse", attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request: Retry-After if given, else jittered backoff"""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return 2 ** attempt + random.random()
+
+def stop_on_sigint(callback):
+    """Call callback on Ctrl+C instead of raising KeyboardInterrupt, where the loop supports signal handlers"""
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, callback)
+    except NotImplementedError:  # e.g. Windows, where Ctrl+C still raises KeyboardInterrupt
+        pass
+
+# Local "YYYY-MM-DDTHH:MM:SS" for the current second, reformatted only when the second changes
+_ts_cache = [0, ""]
+
+def _second_stamp(sec: int) -> str:
+    if sec != _ts_cache[0]:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return _ts_cache[1]
+
+def iso_timestamp_seconds() -> str:
+    """Local time as YYYY-MM-DDTHH:MM:SS, like datetime.now().isoformat(timespec='seconds')"""
+    return _second_stamp(int(time.time()))
+
+def iso_timestamp_micros() -> str:
+    """Local time as YYYY-MM-DDTHH:MM:SS.ffffff, like datetime.now().isoformat(timespec='microseconds')
+
+    The fraction is always present, unlike plain isoformat(), which drops it
+    when the microsecond is 0.
+    """
+    now = time.time()
+    sec = int(now)
+    return f"{_second_stamp(sec)}.{int((now - sec) * 1_000_000):06d}"
+
+def run(main_coro):
+    """Run the demo on uvloop when it is installed, else on the default asyncio loop"""
+    if uvloop is None:
+        return asyncio.run(main_coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main_coro)
+    # Before 3.11 there is no Runner; only scripts that don't need 3.11 features get here
+    uvloop.install()
+    return asyncio.run(main_coro)
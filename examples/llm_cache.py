@@ -0,0 +1,130 @@
+"""
+LLM Response Cache for the example agents
+
+Stores OpenRouter responses in a small SQLite file keyed on a hash of
+(model, system prompt, context turns, user prompt, temperature, max_tokens), so deterministic prompts
+are answered locally - including across demo restarts.
+
+Only calls made at temperature 0, or explicitly marked cacheable, are cached.
+Concurrent misses for the same key share one upstream request.
+SQLite is only touched from one worker thread, so disk reads and commits
+never block the event loop; entries already seen are answered from memory.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = os.getenv('ACT_LLM_CACHE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.llm_cache.sqlite3'))
+
+class LLMCache:
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._memory: Dict[str, str] = {}
+        self._warned = False
+        # A single worker owns the connection, so every database call runs on the same thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+        return self._db
+
+    def _read(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _write(self, key: str, response: str):
+        db = self._connect()
+        db.execute("INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", (key, response))
+        db.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        response = self._memory.get(key)
+        if response is None:
+            response = await asyncio.get_running_loop().run_in_executor(self._executor, self._read, key)
+            if response is not None:
+                self._memory[key] = response
+        return response
+
+    async def set(self, key: str, response: str):
+        self._memory[key] = response
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._write, key, response)
+
+    def report(self, error: sqlite3.Error):
+        """Warn about an unusable cache file, once per process"""
+        if not self._warned:
+            self._warned = True
+            logger.warning("LLM cache at %s unavailable, continuing uncached: %s", self.path, error)
+
+    def stats(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+def cache_key(model: str, system: Optional[str], user: str, temperature: float, context: Sequence[dict] = (),
+              max_tokens: Optional[int] = None) -> str:
+    payload = json.dumps({"m": model, "s": system, "c": list(context), "u": user, "t": temperature, "n": max_tokens},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+llm_cache = LLMCache()
+
+# Cache misses currently being fetched, so identical concurrent requests await a single call
+_inflight: Dict[str, asyncio.Future] = {}
+
+async def cached_call(model: str, system: Optional[str], user: str, temperature: float,
+                      fn: Callable[[], Awaitable[Optional[str]]], cacheable: bool = False,
+                      context: Sequence[dict] = (), max_tokens: Optional[int] = None) -> Optional[str]:
+    """Return a cached response, or await fn() and cache its result
+
+    fn returns None when the request failed; failures are passed through
+    and never cached. A cache file that can't be read or written only costs
+    the lookup: the call is made uncached.
+    """
+    if not (cacheable or temperature == 0):
+        return await fn()
+
+    key = cache_key(model, system, user, temperature, context, max_tokens)
+    pending = _inflight.get(key)
+    if pending is not None:
+        llm_cache.hits += 1
+        return await asyncio.shield(pending)
+
+    # Registered before the database read, so callers arriving during the read wait on this lookup
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        try:
+            cached = await llm_cache.get(key)
+        except sqlite3.Error as e:
+            llm_cache.report(e)
+            cached = None
+        if cached is not None:
+            llm_cache.hits += 1
+            future.set_result(cached)
+            return cached
+
+        llm_cache.misses += 1
+        response = await fn()
+        future.set_result(response)
+        if response is not None:
+            try:
+                await llm_cache.set(key, response)
+            except sqlite3.Error as e:
+                llm_cache.report(e)
+        return response
+    finally:
+        # Waiters see a failed or cancelled fetch as a failed request
+        if not future.done():
+            future.set_result(None)
+        _inflight.pop(key, None)
@@ -13,29 +13,39 @@ Showcases:
 """
 
 import asyncio
-import socketio
-from datetime import datetime
+import logging
+
+from demo_common import setup_logging
+
+logger = logging.getLogger("act.demo")
 
 class MultiAgent:
+    __slots__ = ('agent_id', 'name', 'capabilities', '_cap_str', 'color', 'sio', 'tasks_completed', '_stop_event')
+
+    # Running total across every agent, so reporting never has to re-sum
+    total_tasks_completed = 0
+
     def __init__(self, agent_id, name, capabilities, color="🤖"):
         self.agent_id = agent_id
         self.name = name
-        self.capabilities = capabilities
+        self.capabilities = tuple(capabilities)
+        self._cap_str = ', '.join(self.capabilities)
         self.color = color
+        import socketio  # deferred to keep startup fast
         self.sio = socketio.AsyncClient()
         self.tasks_completed = 0
-        self.is_running = True
+        self._stop_event = asyncio.Event()
         self.setup_events()
 
     def setup_events(self):
         @self.sio.event
         async def connect():
-            print(f"✅ {self.name} connected!")
+            logger.info(f"✅ {self.name} connected!")
             await self.register()
 
         @self.sio.event
         async def agent_registered(data):
-            print(f"🎯 {self.name} registered with capabilities: {', '.join(self.capabilities)}")
+            logger.info(f"🎯 {self.name} registered with capabilities: {self._cap_str}")
 
         @self.sio.event
         async def task_assigned(data):
@@ -44,7 +54,7 @@ class MultiAgent:
         @self.sio.event
         async def task_created(data):
             task_desc = data.get('task', {}).get('description', 'Unknown')
-            print(f"📝 {self.name} sees: {task_desc}")
+            logger.info(f"📝 {self.name} sees: {task_desc}")
 
     async def register(self):
         await self.sio.emit('register_agent', {
@@ -61,7 +71,7 @@ class MultiAgent:
         task_id = task.get('id')
         description = task.get('description')
 
-        print(f"\\n{self.color} {self.name} WORKING ON: {description}")
+        logger.info(f"\\n{self.color} {self.name} WORKING ON: {description}")
 
         # Realistic work simulation
         work_steps = 4
@@ -77,26 +87,28 @@ class MultiAgent:
                 'agentId': self.agent_id
             })
 
-            print(f"📈 {self.name} progress: {int(progress)}%")
+            logger.info(f"📈 {self.name} progress: {int(progress)}%")
 
         self.tasks_completed += 1
-        print(f"✅ {self.name} DONE! ({self.tasks_completed} total)")
+        MultiAgent.total_tasks_completed += 1
+        logger.info(f"✅ {self.name} DONE! ({self.tasks_completed} total)")
 
     async def start(self):
         try:
             await self.sio.connect('http://localhost:8080')
-            while self.is_running:
-                await asyncio.sleep(0.5)
+            await self._stop_event.wait()
         except Exception as e:
-            print(f"❌ {self.name}: {e}")
+            logger.info(f"❌ {self.name}: {e}")
         finally:
             await self.sio.disconnect()
 
-    async def stop(self):
-        self.is_running = False
+    def stop(self):
+        """Stop the agent; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 class DemoTaskCreator:
     def __init__(self):
+        import socketio  # deferred to keep startup fast
         self.sio = socketio.AsyncClient()
         self.demo_tasks = [
             ("Build user authentication API", ["backend", "security"]),
@@ -115,8 +127,8 @@ class DemoTaskCreator:
         await self.sio.connect('http://localhost:8080')
         await asyncio.sleep(3)  # Let agents register
 
-        print("\\n🚀 STARTING AUTONOMOUS TASK GENERATION")
-        print("=" * 50)
+        logger.info("\\n🚀 STARTING AUTONOMOUS TASK GENERATION")
+        logger.info("=" * 50)
 
         for i, (description, capabilities) in enumerate(self.demo_tasks):
             await asyncio.sleep(2.5)  # Realistic spacing
@@ -127,17 +139,17 @@ class DemoTaskCreator:
                 'priority': 'medium'
             })
 
-            print(f"📋 Created task {i+1}/10: {description}")
+            logger.info(f"📋 Created task {i+1}/10: {description}")
 
-        print("\\n🎯 All tasks created! Watch agents coordinate autonomously...")
+        logger.info("\\n🎯 All tasks created! Watch agents coordinate autonomously...")
         await self.sio.disconnect()
 
 async def main():
-    print("🚀 ACT MULTI-AGENT COORDINATION DEMO")
-    print("=" * 60)
-    print("🤖 Launching specialized agents...")
-    print("⚡ Watch autonomous task assignment based on capabilities")
-    print("🔥 Press Ctrl+C to stop\\n")
+    logger.info("🚀 ACT MULTI-AGENT COORDINATION DEMO")
+    logger.info("=" * 60)
+    logger.info("🤖 Launching specialized agents...")
+    logger.info("⚡ Watch autonomous task assignment based on capabilities")
+    logger.info("🔥 Press Ctrl+C to stop\\n")
 
     # Create diverse agent team
     agents = [
@@ -150,7 +162,7 @@ async def main():
     task_creator = DemoTaskCreator()
 
     try:
-        print("🔗 Connecting agents to ACT server...")
+        logger.info("🔗 Connecting agents to ACT server...")
 
         # Start all agents
         agent_tasks = [asyncio.create_task(agent.start()) for agent in agents]
@@ -162,23 +174,27 @@ async def main():
         await asyncio.gather(*agent_tasks, generation_task)
 
     except KeyboardInterrupt:
-        print("\\n\\n🛑 Demo stopping...")
+        logger.info("\\n\\n🛑 Demo stopping...")
 
         # Graceful shutdown
         for agent in agents:
-            await agent.stop()
+            agent.stop()
 
-        print("\\n📊 FINAL RESULTS:")
-        print("=" * 30)
-        total_tasks = sum(agent.tasks_completed for agent in agents)
+        logger.info("\\n📊 FINAL RESULTS:")
+        logger.info("=" * 30)
+        total_tasks = MultiAgent.total_tasks_completed
 
         for agent in agents:
             efficiency = f"({agent.tasks_completed}/{total_tasks})" if total_tasks > 0 else "(0/0)"
-            print(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks {efficiency}")
+            logger.info(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks {efficiency}")
 
-        print(f"\\n🎉 Total coordinated tasks: {total_tasks}")
-        print("💡 Agents self-organized based on capabilities!")
-        print("🚀 Autonomous multi-agent coordination demonstrated!")
+        logger.info(f"\\n🎉 Total coordinated tasks: {total_tasks}")
+        logger.info("💡 Agents self-organized based on capabilities!")
+        logger.info("🚀 Autonomous multi-agent coordination demonstrated!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        asyncio.run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -10,61 +10,146 @@ This creates actual intelligent agents that:
 """
 
 import asyncio
+import json
 import socketio
 import aiohttp
-import json
+import orjson
+import logging
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import re
+from collections import deque
+from typing import AsyncIterator, List, Optional, Sequence
+
+from llm_cache import cached_call, llm_cache
+from demo_common import (
+    MAX_RETRIES, RETRY_STATUSES, AgentBus, EmitTracker, OrjsonModule, iso_timestamp_micros, model_semaphore,
+    new_openrouter_session, retry_delay, run, setup_logging, stop_on_sigint
+)
+
+logger = logging.getLogger("act.agent")
+
+# Prompt templates, filled in with str.format at the call sites
+INTRO_PROMPT = """Generate a brief, friendly introduction (1-2 sentences) to other AI agents you'll be working with.
+Be professional but show your personality."""
+
+ANALYSIS_PROMPT = """You've been assigned this task: "{description}"
+
+Please:
+1. Analyze what this task requires
+2. Determine your approach to complete it
+3. Identify any challenges or considerations
+4. Provide a brief work plan
+
+Respond in character, showing your reasoning process."""
+
+PHASE_PROMPT = """You are currently in the "{phase}" phase of task: "{description}"
+
+Based on your earlier analysis, what are you doing in this phase?
+Provide a brief update (1-2 sentences) on your progress."""
+
+COMPLETION_PROMPT = """You just completed the task: "{description}"
+
+Provide a brief summary of what you accomplished and any key results or deliverables."""
+
+RESPONSE_PROMPT = """Another AI agent "{sender}" sent you this message: "{message}"
+
+Your recent messages in this session:
+{history}
+
+Check your prior messages before responding to avoid repeating yourself.
+Reply with a brief, helpful response, or output exactly NO_RESPONSE if no reply is needed."""
+
+BATCH_PROMPT = """Answer each of these {count} requests separately:
+
+{numbered}
+
+Reply with only a JSON array of {count} strings, one answer per request, in order."""
+
+PHASES = ("Planning", "Implementation", "Testing", "Completion")
+
+WORD_RE = re.compile(r"\w+")
+
+_JSON_DECODER = json.JSONDecoder()
+
+def parse_batch_reply(reply: str, count: int) -> Optional[List[str]]:
+    """Find the JSON array of count strings in a batched reply, or None if there isn't one
+
+    Decoding is tried from every '[', so brackets in any preamble (like "1. [x] ...") are skipped over.
+    """
+    start = reply.find('[')
+    while start != -1:
+        try:
+            answers, _ = _JSON_DECODER.raw_decode(reply, start)
+        except ValueError:
+            answers = None
+        if isinstance(answers, list) and len(answers) == count and all(isinstance(answer, str) for answer in answers):
+            return [answer.strip() for answer in answers]
+        start = reply.find('[', start + 1)
+    return None
 
 class RealAIAgent:
     def __init__(self, agent_id: str, name: str, capabilities: List[str],
-                 model: str, personality: str, color: str = "🤖"):
+                 model: str, personality: str, color: str = "🤖",
+                 bus: Optional[AgentBus] = None, http: Optional[aiohttp.ClientSession] = None):
         self.agent_id = agent_id
         self.name = name
         self.capabilities = capabilities
         self.model = model  # OpenRouter model
         self.personality = personality
         self.color = color
-        self.sio = socketio.AsyncClient()
+        # Agents in one process share a bus (and its Socket.IO connection); a lone agent gets its own
+        self.bus = bus if bus is not None else AgentBus()
+        self.sio = self.bus.sio
         self.tasks_completed = 0
-        self.is_running = True
-        self.conversation_history = []
+        self._stop_event = asyncio.Event()
+        self._emits = EmitTracker(self.sio)  # fire-and-forget emits, drained on shutdown
+        self.conversation_history = deque(maxlen=5)  # this agent's latest outgoing messages
+        self._capabilities_str = ', '.join(self.capabilities)
+        self._cap_set = frozenset(map(str.lower, self.capabilities))
+        # Words that make a peer message worth an LLM reply: this agent's name or any capability
+        self._reply_words = self._cap_set | {self.name.lower()}
 
         # OpenRouter API setup
         self.api_key = os.getenv('OPENROUTER_API_KEY')
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable required")
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
 
-        self.setup_event_handlers()
-
-    def setup_event_handlers(self):
-        @self.sio.event
-        async def connect():
-            print(f"✅ {self.name} ({self.model}) connected to ACT server!")
-            await self.register_agent()
+        # Pooled HTTP session reused for every OpenRouter call: shared if passed in, else opened in start()
+        self.session: Optional[aiohttp.ClientSession] = http
+        self._owns_session = http is None
 
-        @self.sio.event
-        async def agent_registered(data):
-            print(f"🎯 {self.name} registered with capabilities: {', '.join(self.capabilities)}")
+        # Everything static about the agent lives in one system prompt at the very start of
+        # every request, so providers with prompt caching can reuse the prefix across calls
+        self._system_prompt = (
+            f"You are {self.name}, an AI agent with expertise in: {self._capabilities_str}.\n"
+            f"Your personality: {self.personality}\n"
+            "Build on your earlier reasoning in this conversation instead of starting over, and stay in character."
+        )
+        if self.model.startswith("anthropic/"):
+            system_content = [{"type": "text", "text": self._system_prompt, "cache_control": {"type": "ephemeral"}}]
+        else:
+            system_content = self._system_prompt
+        self._system_message = {"role": "system", "content": system_content}
 
-            # Send introduction to other agents
-            intro = await self.generate_introduction()
-            await self.broadcast_message(f"Hello! {intro}")
+    async def on_connect(self):
+        logger.info("✅ %s (%s) connected to ACT server!", self.name, self.model)
+        await self.register_agent()
 
-        @self.sio.event
-        async def agent_joined(data):
-            agent_name = data.get('name', 'Unknown')
-            if agent_name != self.name:
-                print(f"👋 {self.name} notices {agent_name} joined the team")
+    async def on_agent_registered(self, data):
+        logger.info("🎯 %s registered with capabilities: %s", self.name, self._capabilities_str)
 
-        @self.sio.event
-        async def task_assigned(data):
-            await self.handle_real_task(data)
+        # Send introduction to other agents
+        intro = await self.generate_introduction()
+        await self.broadcast_message(f"Hello! {intro}")
 
-        @self.sio.event
-        async def agent_message(data):
-            await self.handle_agent_communication(data)
+    async def on_agent_joined(self, data):
+        agent_name = data.get('name', 'Unknown')
+        if agent_name != self.name:
+            logger.info("👋 %s notices %s joined the team", self.name, agent_name)
 
     async def register_agent(self):
         await self.sio.emit('register_agent', {
@@ -77,49 +162,141 @@ class RealAIAgent:
 
     async def generate_introduction(self) -> str:
         """Generate AI-powered introduction"""
-        prompt = f"""You are {self.name}, an AI agent with these capabilities: {', '.join(self.capabilities)}.
-Your personality: {self.personality}
-
-Generate a brief, friendly introduction (1-2 sentences) to other AI agents you'll be working with.
-Be professional but show your personality."""
-
-        response = await self.call_openrouter_api(prompt)
+        # Kept warm so each agent's introduction still shows some personality
+        response = await self.call_openrouter_api(INTRO_PROMPT, max_tokens=60, temperature=0.7)
         return response.strip()
 
-    async def call_openrouter_api(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Call OpenRouter API with the agent's model"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+    async def call_openrouter_api(self, prompt: str, context: Sequence[dict] = (), cacheable: bool = False,
+                                  max_tokens: int = 60, temperature: float = 0.0) -> str:
+        """Call OpenRouter API with the agent's model, answering repeat prompts from the LLM cache
+
+        Messages go static-first: the agent's system prompt, then any earlier
+        turns from the current task, then the new user prompt. The defaults suit
+        short probes; at temperature 0 the response is always cacheable.
+        """
+        response = await self._request_completion(prompt, context, cacheable, max_tokens, temperature)
+        return response if response is not None else "Error: Could not process request"
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+    async def _request_completion(self, prompt: str, context: Sequence[dict], cacheable: bool,
+                                  max_tokens: int, temperature: float) -> Optional[str]:
+        """call_openrouter_api without the error reply: None when the request failed"""
+        messages = [self._system_message, *context, {"role": "user", "content": prompt}]
 
         data = {
             "model": self.model,
             "messages": messages,
-            "max_tokens": 500,
-            "temperature": 0.7
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        body = orjson.dumps(data)
+
+        async def request() -> Optional[str]:
+            async with model_semaphore(self.model):
+                for attempt in range(MAX_RETRIES + 1):
+                    async with self.session.post(
+                        "https://openrouter.ai/api/v1/chat/completions",
+                        headers=self._headers,
+                        data=body
+                    ) as response:
+                        if response.status == 200:
+                            result = orjson.loads(await response.read())
+                            return result["choices"][0]["message"]["content"]
+                        if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                            error_text = await response.text()
+                            logger.info("❌ %s API error: %s - %s", self.name, response.status, error_text)
+                            return None
+                        delay = retry_delay(response, attempt)
+                    await asyncio.sleep(delay)
+
+        return await cached_call(self.model, self._system_prompt, prompt, temperature, request, cacheable,
+                                 context, max_tokens)
+
+    async def stream_openrouter(self, prompt: str, context: Sequence[dict] = (),
+                                max_tokens: int = 500, temperature: float = 0.7) -> AsyncIterator[str]:
+        """Stream a completion from OpenRouter, yielding content deltas as they arrive
+
+        Streamed calls skip the LLM cache, so keep cacheable prompts on call_openrouter_api.
+        """
+        data = {
+            "model": self.model,
+            "messages": [self._system_message, *context, {"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
         }
+        body = orjson.dumps(data)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers=headers,
-                json=data
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    error_text = await response.text()
-                    print(f"❌ {self.name} API error: {response.status} - {error_text}")
-                    return f"Error: Could not process request"
-
-    async def handle_real_task(self, data):
+        # Like call_openrouter_api, failures end in the error reply rather than an exception,
+        # unless some of the answer has already been streamed
+        streamed = False
+        try:
+            async with model_semaphore(self.model):
+                for attempt in range(MAX_RETRIES + 1):
+                    async with self.session.post(
+                        "https://openrouter.ai/api/v1/chat/completions",
+                        headers=self._headers,
+                        data=body
+                    ) as response:
+                        if response.status == 200:
+                            # Server-sent events: "data: {...}" lines, ": ..." keep-alive comments, "data: [DONE]" at the end
+                            async for line in response.content:
+                                if not line.startswith(b"data: "):
+                                    continue
+                                payload = line[6:].strip()
+                                if payload == b"[DONE]":
+                                    break
+                                chunk = orjson.loads(payload)
+                                if "error" in chunk:
+                                    logger.info("❌ %s stream error: %s", self.name, chunk["error"])
+                                    break
+                                # Usage-only chunks carry an empty choices list
+                                choices = chunk.get("choices") or ({},)
+                                delta = (choices[0].get("delta") or {}).get("content")
+                                if delta:
+                                    streamed = True
+                                    yield delta
+                            if not streamed:
+                                yield "Error: Could not process request"
+                            return
+                        if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                            error_text = await response.text()
+                            logger.info("❌ %s API error: %s - %s", self.name, response.status, error_text)
+                            yield "Error: Could not process request"
+                            return
+                        delay = retry_delay(response, attempt)
+                    await asyncio.sleep(delay)
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.info("❌ %s stream failed: %s", self.name, e)
+            if not streamed:
+                yield "Error: Could not process request"
+
+    async def call_batch(self, prompts: List[str], max_tokens: Sequence[int], context: Sequence[dict] = (),
+                         cacheable: bool = False, temperature: float = 0.0) -> List[str]:
+        """Answer several prompts with a single OpenRouter request
+
+        The prompts are numbered into one message and the model is asked for a
+        JSON array with one answer each, max_tokens[i] being the budget for
+        answer i. Replies that can't be split that way fall back to one request
+        per prompt; if the batched request itself fails, every answer is the
+        error reply rather than N more requests to the same model.
+        """
+        numbered = "\n\n".join(f"{i}. {prompt}" for i, prompt in enumerate(prompts, 1))
+        batch_prompt = BATCH_PROMPT.format(count=len(prompts), numbered=numbered)
+
+        # Leave a few tokens per answer for the JSON quoting around it
+        batch_tokens = sum(max_tokens) + 10 * len(prompts)
+        reply = await self._request_completion(batch_prompt, context, cacheable, batch_tokens, temperature)
+        if reply is None:
+            return ["Error: Could not process request"] * len(prompts)
+        answers = parse_batch_reply(reply, len(prompts))
+        if answers is None:
+            return list(await asyncio.gather(*(
+                self.call_openrouter_api(prompt, context, cacheable, tokens, temperature)
+                for prompt, tokens in zip(prompts, max_tokens)
+            )))
+        return answers
+
+    async def handle_task_assignment(self, data):
         """Handle actual task assignment with AI reasoning"""
         if data.get('agentId') != self.agent_id:
             return
@@ -128,123 +305,125 @@ Be professional but show your personality."""
         task_id = task.get('id')
         description = task.get('description')
 
-        print(f"\n{self.color} {self.name} analyzing task: {description}")
+        logger.info("\n%s %s analyzing task: %s", self.color, self.name, description)
 
         # AI analyzes the task
-        analysis_prompt = f"""You are {self.name}, an AI agent with capabilities: {', '.join(self.capabilities)}.
-Your personality: {self.personality}
-
-You've been assigned this task: "{description}"
-
-Please:
-1. Analyze what this task requires
-2. Determine your approach to complete it
-3. Identify any challenges or considerations
-4. Provide a brief work plan
-
-Respond as {self.name} would, showing your reasoning process."""
-
-        system_prompt = f"You are {self.name}. {self.personality} You have expertise in: {', '.join(self.capabilities)}."
-
-        analysis = await self.call_openrouter_api(analysis_prompt, system_prompt)
-        print(f"🧠 {self.name} thinks: {analysis[:200]}..." if len(analysis) > 200 else f"🧠 {self.name} thinks: {analysis}")
+        analysis_prompt = ANALYSIS_PROMPT.format(description=description)
+
+        # Stream the analysis and tell the other agents about the approach as soon as
+        # its first 100 characters are in, while the rest is still being generated
+        parts = []
+        received = 0
+        announced = False
+        async for delta in self.stream_openrouter(analysis_prompt):
+            parts.append(delta)
+            received += len(delta)
+            if not announced and received >= 100:
+                approach = "".join(parts)[:100]
+                await self.broadcast_message(f"Starting work on: {description}. My approach: {approach}...")
+                announced = True
+        analysis = "".join(parts)
+        logger.info("🧠 %s thinks: %s", self.name, f"{analysis[:200]}..." if len(analysis) > 200 else analysis)
 
         # Notify other agents about starting work
-        await self.broadcast_message(f"Starting work on: {description}. My approach: {analysis[:100]}...")
-
-        # AI actually works on the task in phases
-        phases = ["Planning", "Implementation", "Testing", "Completion"]
-
-        for i, phase in enumerate(phases):
-            progress = ((i + 1) / len(phases)) * 100
-
-            # AI thinks about each phase
-            phase_prompt = f"""You are currently in the "{phase}" phase of task: "{description}"
+        if not announced:
+            await self.broadcast_message(f"Starting work on: {description}. My approach: {analysis[:100]}...")
+
+        # Phase updates and the completion summary only depend on the task, so ask for them all in one
+        # request that continues from the analysis exchange
+        context = (
+            {"role": "user", "content": analysis_prompt},
+            {"role": "assistant", "content": analysis}
+        )
+        phase_prompts = [PHASE_PROMPT.format(phase=phase, description=description) for phase in PHASES]
+        completion_prompt = COMPLETION_PROMPT.format(description=description)
 
-Based on your earlier analysis, what are you doing in this phase?
-Provide a brief update (1-2 sentences) on your progress."""
+        *phase_results, completion_summary = await self.call_batch(
+            [*phase_prompts, completion_prompt], [60] * len(phase_prompts) + [150], context, cacheable=True
+        )
 
-            phase_work = await self.call_openrouter_api(phase_prompt, system_prompt)
+        for i, (phase, phase_work) in enumerate(zip(PHASES, phase_results)):
+            progress = ((i + 1) / len(PHASES)) * 100
 
-            print(f"🔄 {self.name} [{phase}]: {phase_work}")
+            logger.info("🔄 %s [%s]: %s", self.name, phase, phase_work)
 
             # Update ACT server
-            await self.sio.emit('update_task_progress', {
+            self._emits.emit('update_task_progress', {
                 'taskId': task_id,
                 'progress': int(progress),
                 'agentId': self.agent_id,
                 'status': f"{phase}: {phase_work[:50]}..."
             })
 
-            await asyncio.sleep(3)  # Realistic work time
-
-        # Generate completion summary
-        completion_prompt = f"""You just completed the task: "{description}"
-
-Provide a brief summary of what you accomplished and any key results or deliverables."""
-
-        completion_summary = await self.call_openrouter_api(completion_prompt, system_prompt)
-
         self.tasks_completed += 1
-        print(f"✅ {self.name} COMPLETED: {completion_summary}")
+        logger.info("✅ %s COMPLETED: %s", self.name, completion_summary)
 
         # Share completion with other agents
         await self.broadcast_message(f"Completed task: {description}. Result: {completion_summary[:100]}...")
 
+    def may_need_reply(self, message: str) -> bool:
+        """Cheap prefilter: only messages naming this agent or one of its capabilities reach the LLM"""
+        return not self._reply_words.isdisjoint(WORD_RE.findall(message.lower()))
+
     async def handle_agent_communication(self, data):
         """Handle messages from other AI agents"""
         sender = data.get('sender')
         message = data.get('message')
 
         if sender != self.name:
-            print(f"💬 {self.name} received from {sender}: {message}")
+            logger.info("💬 %s received from %s: %s", self.name, sender, message)
 
-            # AI decides whether and how to respond
-            response_prompt = f"""Another AI agent "{sender}" sent you this message: "{message}"
+            # Skip the LLM entirely for chatter that has nothing to do with this agent
+            if not self.may_need_reply(message):
+                return
 
-You are {self.name} with personality: {self.personality}
-
-Should you respond to this message? If yes, provide a brief, helpful response.
-If no response needed, just say "NO_RESPONSE".
-"""
+            # One call both decides whether to respond and writes the reply
+            history = "\n".join(self.conversation_history) or "(none yet)"
+            response_prompt = RESPONSE_PROMPT.format(sender=sender, message=message, history=history)
 
             response = await self.call_openrouter_api(response_prompt)
 
-            if response.strip() != "NO_RESPONSE":
+            if not response.strip().startswith("NO_RESPONSE"):
                 await self.broadcast_message(f"@{sender} {response}")
 
     async def broadcast_message(self, message: str):
-        """Send message to other agents"""
-        await self.sio.emit('agent_message', {
+        """Send message to other agents without waiting for the emit"""
+        self.conversation_history.append(message)
+        self._emits.track(self.bus.broadcast(self, {
             'sender': self.name,
             'message': message,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': iso_timestamp_micros()
+        }))
 
     async def start(self):
         """Start the AI agent"""
-        print(f"{self.color} {self.name} ({self.model}) initializing...")
+        logger.info("%s %s (%s) initializing...", self.color, self.name, self.model)
 
         try:
-            await self.sio.connect('http://localhost:8080')
-            print(f"🧠 {self.name} ready for intelligent coordination!")
+            if self._owns_session:
+                self.session = new_openrouter_session()
+            await self.bus.attach(self)
+            logger.info("🧠 %s ready for intelligent coordination!", self.name)
 
-            while self.is_running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
 
         except Exception as e:
-            print(f"❌ {self.name} error: {e}")
+            logger.info("❌ %s error: %s", self.name, e)
         finally:
-            await self.sio.disconnect()
+            await self._emits.drain()
+            await self.bus.detach(self)
+            if self._owns_session and self.session is not None:
+                await self.session.close()
 
-    async def stop(self):
-        self.is_running = False
+    def stop(self):
+        """Stop the agent; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 class TaskCreator:
     """Creates realistic tasks for AI agents"""
 
     def __init__(self):
-        self.sio = socketio.AsyncClient()
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
         self.realistic_tasks = [
             ("Write a technical blog post about microservices architecture", ["writing", "technical", "backend"]),
             ("Create a user onboarding flow wireframe", ["design", "ux", "frontend"]),
@@ -261,62 +440,74 @@ class TaskCreator:
         await self.sio.connect('http://localhost:8080')
         await asyncio.sleep(5)  # Let agents introduce themselves
 
-        print("\n🚀 CREATING REAL TASKS FOR AI AGENTS")
-        print("=" * 50)
-
-        for i, (description, capabilities) in enumerate(self.realistic_tasks):
-            await asyncio.sleep(4)  # Give time for previous task
+        logger.info("\n🚀 CREATING REAL TASKS FOR AI AGENTS")
+        logger.info("=" * 50)
 
-            await self.sio.emit('create_task', {
+        # Emits share one socket, so send them all at once instead of pacing them out
+        await asyncio.gather(*(
+            self.sio.emit('create_task', {
                 'description': description,
                 'requiredCapabilities': capabilities,
                 'priority': 'medium'
             })
+            for description, capabilities in self.realistic_tasks
+        ))
 
-            print(f"📋 Task {i+1}: {description}")
+        for i, (description, capabilities) in enumerate(self.realistic_tasks):
+            logger.info("📋 Task %s: %s", i+1, description)
 
-        print("\n🎯 All real tasks created! Watch AI agents think and work...")
+        logger.info("\n🎯 All real tasks created! Watch AI agents think and work...")
         await self.sio.disconnect()
 
 async def main():
     """Main demo with real AI agents"""
-    print("🤖 REAL AI AGENT COORDINATION DEMO")
-    print("=" * 60)
-    print("🧠 Using OpenRouter API with actual AI models")
-    print("💬 Agents will communicate, reason, and actually work on tasks")
-    print("🔥 Press Ctrl+C to stop\n")
+    logger.info("🤖 REAL AI AGENT COORDINATION DEMO")
+    logger.info("=" * 60)
+    logger.info("🧠 Using OpenRouter API with actual AI models")
+    logger.info("💬 Agents will communicate, reason, and actually work on tasks")
+    logger.info("🔥 Press Ctrl+C to stop\n")
 
     # Check for API key
     if not os.getenv('OPENROUTER_API_KEY'):
-        print("❌ Please set OPENROUTER_API_KEY environment variable")
+        logger.info("❌ Please set OPENROUTER_API_KEY environment variable")
         return
 
+    # One Socket.IO connection and one OpenRouter connection pool for the whole team
+    bus = AgentBus()
+    http = new_openrouter_session()
+
     # Create diverse AI agent team with different models and personalities
     agents = [
         RealAIAgent(
             "frontend_ai", "Sarah", ["frontend", "design", "ux"],
             "mistralai/mistral-7b-instruct:free",
             "Creative and user-focused frontend developer who loves clean, intuitive designs",
-            "🎨"
+            "🎨", bus=bus, http=http
         ),
         RealAIAgent(
             "backend_ai", "Marcus", ["backend", "database", "security"],
             "meta-llama/llama-3.1-8b-instruct:free",
             "Systematic backend engineer focused on scalability and security",
-            "⚙️"
+            "⚙️", bus=bus, http=http
         ),
         RealAIAgent(
             "analyst_ai", "Elena", ["analysis", "research", "documentation"],
             "google/gemma-2-9b-it:free",
             "Detail-oriented analyst who loves turning data into insights",
-            "📊"
+            "📊", bus=bus, http=http
         )
     ]
 
     task_creator = TaskCreator()
 
+    def stop_all():
+        logger.info("\n\n🛑 Stopping AI agent coordination...")
+        task_generation.cancel()  # no-op once the tasks are created
+        for agent in agents:
+            agent.stop()
+
     try:
-        print("🔗 Connecting AI agents to ACT server...")
+        logger.info("🔗 Connecting AI agents to ACT server...")
 
         # Start all AI agents
         agent_tasks = [asyncio.create_task(agent.start()) for agent in agents]
@@ -324,22 +515,32 @@ async def main():
         # Create realistic tasks
         task_generation = asyncio.create_task(task_creator.create_realistic_tasks())
 
-        # Run coordination
-        await asyncio.gather(*agent_tasks, task_generation)
+        # Ctrl+C wakes every agent at once instead of interrupting the loop
+        stop_on_sigint(stop_all)
+
+        # Run coordination; the cancelled task generator is collected instead of raised
+        await asyncio.gather(*agent_tasks, task_generation, return_exceptions=True)
 
     except KeyboardInterrupt:
-        print("\n\n🛑 Stopping AI agent coordination...")
+        logger.info("\n\n🛑 Stopping AI agent coordination...")
 
         for agent in agents:
-            await agent.stop()
+            agent.stop()
+    finally:
+        await http.close()
 
-        print("\n🧠 AI AGENT COORDINATION RESULTS:")
-        print("=" * 40)
-        for agent in agents:
-            print(f"  {agent.color} {agent.name} ({agent.model}): {agent.tasks_completed} tasks completed")
+    logger.info("\n🧠 AI AGENT COORDINATION RESULTS:")
+    logger.info("=" * 40)
+    for agent in agents:
+        logger.info("  %s %s (%s): %s tasks completed", agent.color, agent.name, agent.model, agent.tasks_completed)
+    logger.info("💾 LLM cache: %s", llm_cache.stats())
 
-        print("\n🎉 Real AI agents coordinated autonomously!")
-        print("💡 Agents actually reasoned, communicated, and solved problems!")
+    logger.info("\n🎉 Real AI agents coordinated autonomously!")
+    logger.info("💡 Agents actually reasoned, communicated, and solved problems!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -13,12 +13,17 @@ import asyncio
 import sys
 import os
 import json
+import logging
 from datetime import datetime
 
 # Add SDK to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'sdk', 'python'))
 from act_client import ACTClient
 
+from demo_common import run, setup_logging, stop_on_sigint
+
+logger = logging.getLogger("act.agent")
+
 class SimpleAgent:
     def __init__(self, name, capabilities):
         self.name = name
@@ -30,59 +35,68 @@ class SimpleAgent:
             agent_name=name
         )
         self.tasks_completed = 0
+        self._stop_event = asyncio.Event()
 
     async def connect_and_run(self):
         """Connect to ACT server and start autonomous coordination"""
-        print(f"🤖 {self.name} starting up...")
-        print(f"📋 Capabilities: {', '.join(self.capabilities)}")
-        print(f"🔗 Connecting to ACT Server at ws://localhost:8080")
+        logger.info("🤖 %s starting up...", self.name)
+        logger.info("📋 Capabilities: %s", ', '.join(self.capabilities))
+        logger.info("🔗 Connecting to ACT Server at ws://localhost:8080")
+
+        stop_on_sigint(self.stop)
 
         try:
             # Connect to ACT server
             await self.client.connect()
-            print(f"✅ Connected and registered with ACT server!")
+            logger.info("✅ Connected and registered with ACT server!")
 
             # Set up task handler
             self.client.on('task_assigned', self.handle_task_assignment)
 
             # Keep running and handling tasks
-            print(f"💫 Ready for autonomous coordination!")
-            print(f"⚡ Waiting for task assignments from ACT server...")
-            print(f"🔥 Press Ctrl+C to stop")
+            logger.info("💫 Ready for autonomous coordination!")
+            logger.info("⚡ Waiting for task assignments from ACT server...")
+            logger.info("🔥 Press Ctrl+C to stop")
 
-            while True:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
+            logger.info("\\n🛑 %s shutting down...", self.name)
+            await self.client.disconnect()
+            logger.info("👋 Disconnected. Tasks completed: %s", self.tasks_completed)
 
         except KeyboardInterrupt:
-            print(f"\\n🛑 {self.name} shutting down...")
+            logger.info("\\n🛑 %s shutting down...", self.name)
             await self.client.disconnect()
-            print(f"👋 Disconnected. Tasks completed: {self.tasks_completed}")
+            logger.info("👋 Disconnected. Tasks completed: %s", self.tasks_completed)
         except Exception as e:
-            print(f"❌ Error: {e}")
+            logger.info("❌ Error: %s", e)
             await self.client.disconnect()
 
+    def stop(self):
+        """Ask connect_and_run() to disconnect; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
+
     async def handle_task_assignment(self, data):
         """Handle task assignments from ACT server"""
         task = data.get('task', {})
         task_id = task.get('id')
         description = task.get('description', 'Unknown task')
 
-        print(f"\\n🎯 TASK ASSIGNED: {description}")
-        print(f"📝 Task ID: {task_id}")
+        logger.info("\\n🎯 TASK ASSIGNED: %s", description)
+        logger.info("📝 Task ID: %s", task_id)
 
         # Simulate working on the task
-        print(f"🔄 Working on task...")
+        logger.info("🔄 Working on task...")
 
         # Update progress
         for progress in [25, 50, 75, 100]:
             await asyncio.sleep(1)
             await self.client.update_task_progress(task_id, progress)
-            print(f"📈 Progress: {progress}%")
+            logger.info("📈 Progress: %s%%", progress)
 
-        print(f"✅ Task completed!")
+        logger.info("✅ Task completed!")
         self.tasks_completed += 1
-        print(f"📊 Total tasks completed: {self.tasks_completed}")
-        print(f"⚡ Ready for next task...")
+        logger.info("📊 Total tasks completed: %s", self.tasks_completed)
+        logger.info("⚡ Ready for next task...")
 
 async def create_demo_task():
     """Create a demo task for testing"""
@@ -99,7 +113,7 @@ async def create_demo_task():
         priority="medium"
     )
 
-    print(f"📝 Demo task created: {task_id}")
+    logger.info("📝 Demo task created: %s", task_id)
     await demo_client.disconnect()
 
 async def main():
@@ -123,10 +137,14 @@ async def main():
 async def delayed_task_creation():
     """Create a demo task after 3 seconds"""
     await asyncio.sleep(3)
-    print("\\n📋 Creating demo task...")
+    logger.info("\\n📋 Creating demo task...")
     await create_demo_task()
 
 if __name__ == "__main__":
-    print("🚀 ACT Standalone Agent Demo")
-    print("=" * 40)
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    logger.info("🚀 ACT Standalone Agent Demo")
+    logger.info("=" * 40)
+    try:
+        run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
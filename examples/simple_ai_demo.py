@@ -9,43 +9,76 @@ using OpenRouter API with rate-limiting to avoid errors.
 import asyncio
 import socketio
 import aiohttp
-import json
+import orjson
+import logging
 import os
 from datetime import datetime
 from typing import Optional
 
+from llm_cache import cached_call, llm_cache
+from demo_common import (
+    MAX_RETRIES, RETRY_STATUSES, AgentBus, EmitTracker, OrjsonModule, model_semaphore, new_openrouter_session,
+    retry_delay, run, setup_logging, stop_on_sigint
+)
+
+logger = logging.getLogger("act.agent")
+
+# Prompt templates, filled in with str.format at the call sites
+ANALYSIS_PROMPT = """Task: "{description}"
+
+        As {name}, analyze this task and provide:
+        1. Your approach (1 sentence)
+        2. Key considerations (1 sentence)
+
+        Keep response brief and practical."""
+
+PHASE_PROMPT = """You're in the "{phase}" phase of: "{description}"
+
+            What are you doing now? (1 brief sentence)"""
+
+COMPLETION_PROMPT = """You completed: "{description}"
+
+        Summarize your accomplishment in one sentence."""
+
+PHASES = ("Analysis", "Implementation", "Review", "Delivery")
+
 class SimpleAIAgent:
-    def __init__(self, agent_id: str, name: str, capabilities: list, model: str, personality: str, color: str):
+    def __init__(self, agent_id: str, name: str, capabilities: list, model: str, personality: str, color: str,
+                 bus: Optional[AgentBus] = None, http: Optional[aiohttp.ClientSession] = None):
         self.agent_id = agent_id
         self.name = name
         self.capabilities = capabilities
         self.model = model
         self.personality = personality
         self.color = color
-        self.sio = socketio.AsyncClient()
+        self._capabilities_str = ', '.join(self.capabilities)
+        self._system_prompt = f"You are {self.name}. {self.personality}"
+        # Agents in one process share a bus (and its Socket.IO connection); a lone agent gets its own
+        self.bus = bus if bus is not None else AgentBus()
+        self.sio = self.bus.sio
         self.tasks_completed = 0
-        self.is_running = True
+        self._stop_event = asyncio.Event()
+        self._emits = EmitTracker(self.sio)  # fire-and-forget emits, drained on shutdown
         self.api_key = os.getenv('OPENROUTER_API_KEY')
-        self.setup_event_handlers()
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
 
-    def setup_event_handlers(self):
-        @self.sio.event
-        async def connect():
-            print(f"✅ {self.name} ({self.model}) connected!")
-            await self.register_agent()
+        # Pooled HTTP session reused for every OpenRouter call: shared if passed in, else opened in start()
+        self.session: Optional[aiohttp.ClientSession] = http
+        self._owns_session = http is None
 
-        @self.sio.event
-        async def agent_registered(data):
-            print(f"🎯 {self.name} ready with capabilities: {', '.join(self.capabilities)}")
+    async def on_connect(self):
+        logger.info("✅ %s (%s) connected!", self.name, self.model)
+        await self.register_agent()
 
-        @self.sio.event
-        async def task_assigned(data):
-            await self.handle_real_task(data)
+    async def on_agent_registered(self, data):
+        logger.info("🎯 %s ready with capabilities: %s", self.name, self._capabilities_str)
 
-        @self.sio.event
-        async def task_created(data):
-            task_desc = data.get('task', {}).get('description', 'Unknown')
-            print(f"📝 {self.name} sees new task: {task_desc[:50]}...")
+    async def on_task_created(self, data):
+        task_desc = data.get('task', {}).get('description', 'Unknown')
+        logger.info("📝 %s sees new task: %s...", self.name, task_desc[:50])
 
     async def register_agent(self):
         await self.sio.emit('register_agent', {
@@ -54,41 +87,50 @@ class SimpleAIAgent:
             'capabilities': self.capabilities
         })
 
-    async def call_ai_api(self, prompt: str) -> str:
-        """Rate-limited AI API call"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+    async def call_ai_api(self, prompt: str, cacheable: bool = False,
+                          max_tokens: int = 60, temperature: float = 0.0) -> str:
+        """Rate-limited AI API call, answering repeat prompts from the LLM cache
 
+        The defaults suit the one-sentence phase probes; at temperature 0 the response is always cacheable.
+        """
         data = {
             "model": self.model,
             "messages": [
-                {"role": "system", "content": f"You are {self.name}. {self.personality}"},
+                {"role": "system", "content": self._system_prompt},
                 {"role": "user", "content": prompt}
             ],
-            "max_tokens": 200,
-            "temperature": 0.7
+            "max_tokens": max_tokens,
+            "temperature": temperature
         }
+        body = orjson.dumps(data)
+
+        async def request() -> Optional[str]:
+            async with model_semaphore(self.model):
+                for attempt in range(MAX_RETRIES + 1):
+                    async with self.session.post(
+                        "https://openrouter.ai/api/v1/chat/completions",
+                        headers=self._headers,
+                        data=body
+                    ) as response:
+                        if response.status == 200:
+                            result = orjson.loads(await response.read())
+                            return result["choices"][0]["message"]["content"]
+                        if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                            logger.info("❌ %s API error: %s", self.name, response.status)
+                            return None
+                        delay = retry_delay(response, attempt)
+                    await asyncio.sleep(delay)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=data
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result["choices"][0]["message"]["content"]
-                    else:
-                        error = await response.text()
-                        print(f"❌ {self.name} API error: {response.status}")
-                        return f"[AI thinking but API busy - using capability-based response]"
+            response = await cached_call(self.model, self._system_prompt, prompt, temperature, request, cacheable,
+                                         max_tokens=max_tokens)
         except Exception as e:
             return f"[AI processing offline - {self.name} working with built-in knowledge]"
+        if response is None:
+            return f"[AI thinking but API busy - using capability-based response]"
+        return response
 
-    async def handle_real_task(self, data):
+    async def handle_task_assignment(self, data):
         """Handle task with real AI thinking"""
         if data.get('agentId') != self.agent_id:
             return
@@ -97,79 +139,67 @@ class SimpleAIAgent:
         task_id = task.get('id')
         description = task.get('description')
 
-        print(f"\\n{self.color} {self.name} ASSIGNED: {description}")
+        logger.info("\\n%s %s ASSIGNED: %s", self.color, self.name, description)
 
-        # AI analyzes the task (with rate limiting)
-        analysis_prompt = f\"\"\"Task: "{description}"
+        # AI analyzes the task (rate limiting happens per model in call_ai_api)
+        analysis_prompt = ANALYSIS_PROMPT.format(description=description, name=self.name)
 
-        As {self.name}, analyze this task and provide:
-        1. Your approach (1 sentence)
-        2. Key considerations (1 sentence)
-
-        Keep response brief and practical.\"\"\"
-
-        await asyncio.sleep(2)  # Rate limiting
-        analysis = await self.call_ai_api(analysis_prompt)
-
-        print(f"🧠 {self.name}: {analysis}")
-
-        # Work on task in phases with AI thinking
-        phases = ["Analysis", "Implementation", "Review", "Delivery"]
+        analysis = await self.call_ai_api(analysis_prompt, max_tokens=100, temperature=0.7)
 
-        for i, phase in enumerate(phases):
-            progress = ((i + 1) / len(phases)) * 100
+        logger.info("🧠 %s: %s", self.name, analysis)
 
-            # AI thinks about this phase
-            phase_prompt = f\"\"\"You're in the "{phase}" phase of: "{description}"
+        # Phase updates and the completion summary only depend on the task, so ask for them all at once
+        phase_prompts = [PHASE_PROMPT.format(phase=phase, description=description) for phase in PHASES]
+        completion_prompt = COMPLETION_PROMPT.format(description=description)
 
-            What are you doing now? (1 brief sentence)\"\"\"
+        *phase_results, completion = await asyncio.gather(
+            *(self.call_ai_api(phase_prompt, cacheable=True) for phase_prompt in phase_prompts),
+            self.call_ai_api(completion_prompt, cacheable=True, max_tokens=150)
+        )
 
-            await asyncio.sleep(3)  # Realistic work + rate limiting
-            phase_work = await self.call_ai_api(phase_prompt)
+        for i, (phase, phase_work) in enumerate(zip(PHASES, phase_results)):
+            progress = ((i + 1) / len(PHASES)) * 100
 
-            print(f"🔄 {self.name} [{phase}]: {phase_work}")
+            logger.info("🔄 %s [%s]: %s", self.name, phase, phase_work)
 
             # Update ACT server
-            await self.sio.emit('update_task_progress', {
+            self._emits.emit('update_task_progress', {
                 'taskId': task_id,
                 'progress': int(progress),
                 'agentId': self.agent_id,
                 'status': f"{phase} complete"
             })
 
-        # Final completion
-        completion_prompt = f\"\"\"You completed: "{description}"
-
-        Summarize your accomplishment in one sentence.\"\"\"
-
-        await asyncio.sleep(2)
-        completion = await self.call_ai_api(completion_prompt)
-
         self.tasks_completed += 1
-        print(f"✅ {self.name} COMPLETED: {completion}")
+        logger.info("✅ %s COMPLETED: %s", self.name, completion)
 
     async def start(self):
         """Start the AI agent"""
-        print(f"{self.color} {self.name} starting...")
+        logger.info("%s %s starting...", self.color, self.name)
 
         try:
-            await self.sio.connect('http://localhost:8080')
-            print(f"🧠 {self.name} connected for intelligent coordination!")
+            if self._owns_session:
+                self.session = new_openrouter_session()
+            await self.bus.attach(self)
+            logger.info("🧠 %s connected for intelligent coordination!", self.name)
 
-            while self.is_running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
 
         except Exception as e:
-            print(f"❌ {self.name} error: {e}")
+            logger.info("❌ %s error: %s", self.name, e)
         finally:
-            await self.sio.disconnect()
+            await self._emits.drain()
+            await self.bus.detach(self)
+            if self._owns_session and self.session is not None:
+                await self.session.close()
 
-    async def stop(self):
-        self.is_running = False
+    def stop(self):
+        """Stop the agent; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 class SimpleTaskCreator:
     def __init__(self):
-        self.sio = socketio.AsyncClient()
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
         self.realistic_tasks = [
             ("Analyze user feedback and create improvement recommendations", ["analysis", "research"]),
             ("Design a user-friendly login interface", ["frontend", "design"]),
@@ -181,53 +211,65 @@ class SimpleTaskCreator:
         await self.sio.connect('http://localhost:8080')
         await asyncio.sleep(5)  # Let agents connect
 
-        print("\\n📋 CREATING REAL AI TASKS")
-        print("=" * 40)
+        logger.info("\\n📋 CREATING REAL AI TASKS")
+        logger.info("=" * 40)
 
-        for i, (description, capabilities) in enumerate(self.realistic_tasks):
-            await asyncio.sleep(8)  # Space out tasks
-
-            await self.sio.emit('create_task', {
+        # Emits share one socket, so send them all at once instead of spacing them out
+        await asyncio.gather(*(
+            self.sio.emit('create_task', {
                 'description': description,
                 'requiredCapabilities': capabilities,
                 'priority': 'medium'
             })
+            for description, capabilities in self.realistic_tasks
+        ))
 
-            print(f"📝 Task {i+1}: {description}")
+        for i, (description, capabilities) in enumerate(self.realistic_tasks):
+            logger.info("📝 Task %s: %s", i+1, description)
 
         await self.sio.disconnect()
 
 async def main():
-    print("🤖 SIMPLE REAL AI AGENT DEMO")
-    print("=" * 50)
-    print("🧠 Two AI agents that actually think and work")
-    print("⚡ Watch real autonomous coordination")
-    print("🔥 Press Ctrl+C to stop\\n")
+    logger.info("🤖 SIMPLE REAL AI AGENT DEMO")
+    logger.info("=" * 50)
+    logger.info("🧠 Two AI agents that actually think and work")
+    logger.info("⚡ Watch real autonomous coordination")
+    logger.info("🔥 Press Ctrl+C to stop\\n")
 
     if not os.getenv('OPENROUTER_API_KEY'):
-        print("❌ Please set OPENROUTER_API_KEY environment variable")
+        logger.info("❌ Please set OPENROUTER_API_KEY environment variable")
         return
 
+    # One Socket.IO connection and one OpenRouter connection pool for both agents
+    bus = AgentBus()
+    http = new_openrouter_session()
+
     # Create 2 AI agents with different capabilities
     agents = [
         SimpleAIAgent(
             "ai_designer", "Alex", ["frontend", "design", "ux"],
             "mistralai/mistral-7b-instruct:free",
             "Creative frontend developer focused on user experience",
-            "🎨"
+            "🎨", bus=bus, http=http
         ),
         SimpleAIAgent(
             "ai_analyst", "Jordan", ["analysis", "research", "documentation"],
             "google/gemma-2-9b-it:free",
             "Analytical thinker who loves data and documentation",
-            "📊"
+            "📊", bus=bus, http=http
         )
     ]
 
     task_creator = SimpleTaskCreator()
 
+    def stop_all():
+        logger.info("\\n\\n🛑 Stopping AI coordination...")
+        task_generation.cancel()  # no-op once the tasks are created
+        for agent in agents:
+            agent.stop()
+
     try:
-        print("🔗 Starting AI agents...")
+        logger.info("🔗 Starting AI agents...")
 
         # Start agents
         agent_tasks = [asyncio.create_task(agent.start()) for agent in agents]
@@ -235,22 +277,32 @@ async def main():
         # Create tasks
         task_generation = asyncio.create_task(task_creator.create_tasks())
 
-        # Run until interrupted
-        await asyncio.gather(*agent_tasks, task_generation)
+        # Ctrl+C wakes every agent at once instead of interrupting the loop
+        stop_on_sigint(stop_all)
+
+        # Run until interrupted; the cancelled task generator is collected instead of raised
+        await asyncio.gather(*agent_tasks, task_generation, return_exceptions=True)
 
     except KeyboardInterrupt:
-        print("\\n\\n🛑 Stopping AI coordination...")
+        logger.info("\\n\\n🛑 Stopping AI coordination...")
 
         for agent in agents:
-            await agent.stop()
+            agent.stop()
+    finally:
+        await http.close()
 
-        print("\\n🧠 REAL AI COORDINATION RESULTS:")
-        print("=" * 40)
-        for agent in agents:
-            print(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
+    logger.info("\\n🧠 REAL AI COORDINATION RESULTS:")
+    logger.info("=" * 40)
+    for agent in agents:
+        logger.info("  %s %s: %s tasks completed", agent.color, agent.name, agent.tasks_completed)
+    logger.info("💾 LLM cache: %s", llm_cache.stats())
 
-        print("\\n🎉 Real AI agents coordinated autonomously!")
-        print("💡 Agents actually thought, analyzed, and worked on tasks!")
+    logger.info("\\n🎉 Real AI agents coordinated autonomously!")
+    logger.info("💡 Agents actually thought, analyzed, and worked on tasks!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -7,45 +7,50 @@ using Socket.IO for real autonomous coordination.
 """
 
 import asyncio
+import logging
+import os
 import socketio
 import sys
 from datetime import datetime
 
+from demo_common import OrjsonModule, run, setup_logging, stop_on_sigint
+
+logger = logging.getLogger("act.demo")
+
+# Pause between progress updates, for watching the demo; 0 reports them all at once
+PROGRESS_STEP_DELAY = float(os.getenv("ACT_DEMO_STEP_DELAY", "0"))
+
 class SocketIOAgent:
     def __init__(self, agent_id, name, capabilities):
         self.agent_id = agent_id
         self.name = name
         self.capabilities = capabilities
-        self.sio = socketio.AsyncClient()
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
         self.tasks_completed = 0
-        self.setup_event_handlers()
+        self._stop_event = asyncio.Event()
 
-    def setup_event_handlers(self):
-        """Set up Socket.IO event handlers"""
-        @self.sio.event
-        async def connect():
-            print(f"✅ {self.name} connected to ACT server!")
-            await self.register_agent()
+        self.sio.on('connect', self._on_connect)
+        self.sio.on('agent_registered', self._on_agent_registered)
+        self.sio.on('agent_joined', self._on_agent_joined)
+        self.sio.on('task_assigned', self.handle_task_assignment)
+        self.sio.on('task_created', self._on_task_created)
+        self.sio.on('disconnect', self._on_disconnect)
 
-        @self.sio.event
-        async def agent_registered(data):
-            print(f"🎯 {self.name} registered successfully: {data}")
+    async def _on_connect(self):
+        logger.info(f"✅ {self.name} connected to ACT server!")
+        await self.register_agent()
 
-        @self.sio.event
-        async def agent_joined(data):
-            print(f"👋 Agent network updated: {data}")
+    async def _on_agent_registered(self, data):
+        logger.info(f"🎯 {self.name} registered successfully: {data}")
 
-        @self.sio.event
-        async def task_assigned(data):
-            await self.handle_task_assignment(data)
+    async def _on_agent_joined(self, data):
+        logger.info(f"👋 Agent network updated: {data}")
 
-        @self.sio.event
-        async def task_created(data):
-            print(f"📝 New task in system: {data.get('task', {}).get('description')}")
+    async def _on_task_created(self, data):
+        logger.info(f"📝 New task in system: {data.get('task', {}).get('description')}")
 
-        @self.sio.event
-        async def disconnect():
-            print(f"👋 {self.name} disconnected from ACT server")
+    async def _on_disconnect(self):
+        logger.info(f"👋 {self.name} disconnected from ACT server")
 
     async def register_agent(self):
         """Register this agent with ACT server"""
@@ -64,27 +69,32 @@ class SocketIOAgent:
         task_id = task.get('id')
         description = task.get('description', 'Unknown task')
 
-        print(f"\\n🎯 {self.name} ASSIGNED TASK: {description}")
-        print(f"📝 Task ID: {task_id}")
+        logger.info(f"\\n🎯 {self.name} ASSIGNED TASK: {description}")
+        logger.info(f"📝 Task ID: {task_id}")
 
         # Simulate working on task
-        print(f"🔄 {self.name} starting work...")
+        logger.info(f"🔄 {self.name} starting work...")
 
         # Update progress incrementally
-        for progress in [25, 50, 75, 100]:
-            await asyncio.sleep(1.5)
-
-            await self.sio.emit('update_task_progress', {
-                'taskId': task_id,
-                'progress': progress,
-                'agentId': self.agent_id
-            })
-
-            print(f"📈 {self.name} progress: {progress}%")
+        if PROGRESS_STEP_DELAY:
+            for progress in [25, 50, 75, 100]:
+                await asyncio.sleep(PROGRESS_STEP_DELAY)
+                await self.report_progress(task_id, progress)
+        else:
+            await asyncio.gather(*(self.report_progress(task_id, progress) for progress in [25, 50, 75, 100]))
 
         self.tasks_completed += 1
-        print(f"✅ {self.name} COMPLETED TASK! Total: {self.tasks_completed}")
-        print(f"⚡ {self.name} ready for next assignment...\\n")
+        logger.info(f"✅ {self.name} COMPLETED TASK! Total: {self.tasks_completed}")
+        logger.info(f"⚡ {self.name} ready for next assignment...\\n")
+
+    async def report_progress(self, task_id, progress):
+        await self.sio.emit('update_task_progress', {
+            'taskId': task_id,
+            'progress': progress,
+            'agentId': self.agent_id
+        })
+
+        logger.info(f"📈 {self.name} progress: {progress}%")
 
     async def create_demo_task(self, description, required_capabilities):
         """Create a demo task"""
@@ -96,33 +106,39 @@ class SocketIOAgent:
 
     async def connect_and_run(self):
         """Connect to ACT server and run agent"""
-        print(f"🤖 {self.name} starting up...")
-        print(f"📋 Capabilities: {', '.join(self.capabilities)}")
-        print(f"🔗 Connecting to ACT Server...")
+        logger.info(f"🤖 {self.name} starting up...")
+        logger.info(f"📋 Capabilities: {', '.join(self.capabilities)}")
+        logger.info(f"🔗 Connecting to ACT Server...")
+
+        stop_on_sigint(self._stop_event.set)
 
         try:
-            await self.sio.connect('http://localhost:8080')
-            print(f"💫 {self.name} ready for autonomous coordination!")
+            await self.sio.connect('http://localhost:8080', transports=['websocket'])
+            logger.info(f"💫 {self.name} ready for autonomous coordination!")
 
             # Create a demo task after a delay
             await asyncio.sleep(3)
-            print(f"\\n📋 {self.name} creating demo task...")
+            logger.info(f"\\n📋 {self.name} creating demo task...")
             await self.create_demo_task(
                 f"Demo task created by {self.name}",
                 self.capabilities[:1]  # Use first capability
             )
 
-            # Keep running
-            while True:
-                await asyncio.sleep(1)
+            # Keep running until Ctrl+C or stop()
+            await self._stop_event.wait()
+            logger.info(f"\\n🛑 {self.name} shutting down...")
 
         except KeyboardInterrupt:
-            print(f"\\n🛑 {self.name} shutting down...")
+            logger.info(f"\\n🛑 {self.name} shutting down...")
         except Exception as e:
-            print(f"❌ {self.name} error: {e}")
+            logger.info(f"❌ {self.name} error: {e}")
         finally:
             await self.sio.disconnect()
-            print(f"👋 {self.name} disconnected. Tasks completed: {self.tasks_completed}")
+            logger.info(f"👋 {self.name} disconnected. Tasks completed: {self.tasks_completed}")
+
+    def stop(self):
+        """Stop the agent; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 async def main():
     if len(sys.argv) < 2:
@@ -138,6 +154,10 @@ async def main():
     await agent.connect_and_run()
 
 if __name__ == "__main__":
-    print("🚀 ACT Socket.IO Agent Demo")
-    print("=" * 40)
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        logger.info("🚀 ACT Socket.IO Agent Demo")
+        logger.info("=" * 40)
+        run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
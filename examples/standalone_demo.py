@@ -13,11 +13,18 @@ Showcases:
 """
 
 import asyncio
-import sys
+import logging
 import os
 import socketio
 from datetime import datetime
 
+from demo_common import run, setup_logging, stop_on_sigint
+
+logger = logging.getLogger("act.demo")
+
+# Seconds agents get to disconnect after a stop before they are cancelled
+SHUTDOWN_TIMEOUT = 1.0
+
 class DemoAgent:
     def __init__(self, agent_id, name, capabilities, color="🤖"):
         self.agent_id = agent_id
@@ -26,11 +33,11 @@ class DemoAgent:
         self.color = color
         self.client = ACTClient()
         self.tasks_completed = 0
-        self.is_running = True
+        self._stop_event = asyncio.Event()
 
     async def start(self):
         """Start the agent and connect to ACT server"""
-        print(f"{self.color} {self.name} starting...")
+        logger.info(f"{self.color} {self.name} starting...")
 
         try:
             await self.client.connect('ws://localhost:8080')
@@ -41,13 +48,12 @@ class DemoAgent:
             )
 
             self.client.on('task_assigned', self.handle_task)
-            print(f"✅ {self.name} ready for coordination!")
+            logger.info(f"✅ {self.name} ready for coordination!")
 
-            while self.is_running:
-                await asyncio.sleep(0.5)
+            await self._stop_event.wait()
 
         except Exception as e:
-            print(f"❌ {self.name} error: {e}")
+            logger.info(f"❌ {self.name} error: {e}")
         finally:
             await self.client.disconnect()
 
@@ -57,7 +63,7 @@ class DemoAgent:
         task_id = task.get('id')
         description = task.get('description', 'Unknown task')
 
-        print(f"\\n{self.color} {self.name} received: {description}")
+        logger.info(f"\\n{self.color} {self.name} received: {description}")
 
         # Simulate task execution with realistic timing
         work_time = 2 + (len(description) % 3)  # Variable work time
@@ -68,11 +74,11 @@ class DemoAgent:
             await self.client.update_task_progress(task_id, progress)
 
         self.tasks_completed += 1
-        print(f"✅ {self.name} completed task! Total: {self.tasks_completed}")
+        logger.info(f"✅ {self.name} completed task! Total: {self.tasks_completed}")
 
-    async def stop(self):
-        """Stop the agent"""
-        self.is_running = False
+    def stop(self):
+        """Stop the agent; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 class TaskGenerator:
     def __init__(self):
@@ -96,7 +102,7 @@ class TaskGenerator:
 
         await asyncio.sleep(2)  # Let agents register first
 
-        print("\\n📋 Starting task generation...")
+        logger.info("\\n📋 Starting task generation...")
 
         for i, (description, capabilities) in enumerate(self.tasks):
             await asyncio.sleep(3)  # Space out task creation
@@ -107,16 +113,16 @@ class TaskGenerator:
                 priority="medium"
             )
 
-            print(f"📝 Task {i+1}/10: {description}")
+            logger.info(f"📝 Task {i+1}/10: {description}")
 
         await self.client.disconnect()
 
 async def main():
-    print("🚀 ACT Standalone Multi-Agent Demo")
-    print("=" * 50)
-    print("🎯 Demonstrating autonomous agent coordination")
-    print("⚡ Watch agents self-organize based on capabilities")
-    print("🔥 Press Ctrl+C to stop\\n")
+    logger.info("🚀 ACT Standalone Multi-Agent Demo")
+    logger.info("=" * 50)
+    logger.info("🎯 Demonstrating autonomous agent coordination")
+    logger.info("⚡ Watch agents self-organize based on capabilities")
+    logger.info("🔥 Press Ctrl+C to stop\\n")
 
     # Create diverse agents with different capabilities
     agents = [
@@ -129,29 +135,48 @@ async def main():
     # Create task generator
     task_generator = TaskGenerator()
 
+    def stop_all():
+        logger.info("\\n\\n🛑 Demo stopping...")
+        generator_task.cancel()
+        for agent in agents:
+            agent.stop()
+        asyncio.get_running_loop().call_later(SHUTDOWN_TIMEOUT, cancel_laggards)
+
+    def cancel_laggards():
+        for task in agent_tasks:
+            task.cancel()  # no-op for agents that already finished
+
     try:
-        # Start all agents
-        agent_tasks = [asyncio.create_task(agent.start()) for agent in agents]
+        # The group waits for every child, and cancels the rest if one fails or main is interrupted
+        async with asyncio.TaskGroup() as tg:
+            # Start all agents
+            agent_tasks = [tg.create_task(agent.start()) for agent in agents]
 
-        # Start task generation
-        generator_task = asyncio.create_task(task_generator.start_generating_tasks())
+            # Start task generation
+            generator_task = tg.create_task(task_generator.start_generating_tasks())
 
-        # Wait for completion or interruption
-        await asyncio.gather(*agent_tasks, generator_task)
+            # Ctrl+C wakes every agent at once instead of interrupting the loop
+            stop_on_sigint(stop_all)
 
+    except Exception as e:
+        logger.info(f"❌ Demo error: {e}")
     except KeyboardInterrupt:
-        print("\\n\\n🛑 Demo stopping...")
+        logger.info("\\n\\n🛑 Demo stopping...")
 
         # Stop all agents
         for agent in agents:
-            await agent.stop()
+            agent.stop()
 
-        print("\\n📊 Demo Results:")
-        for agent in agents:
-            print(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
+    logger.info("\\n📊 Demo Results:")
+    for agent in agents:
+        logger.info(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
 
-        print("\\n🎉 ACT autonomous coordination demonstrated!")
-        print("💡 Agents self-organized and coordinated without human intervention")
+    logger.info("\\n🎉 ACT autonomous coordination demonstrated!")
+    logger.info("💡 Agents self-organized and coordinated without human intervention")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
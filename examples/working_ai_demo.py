@@ -14,11 +14,62 @@ import asyncio
 import socketio
 import aiohttp
 import json
+import logging
+import orjson
 import os
-import time
-from datetime import datetime
 from typing import Optional, List
 
+from demo_common import OrjsonModule, iso_timestamp_seconds, run, setup_logging, stop_on_sigint
+
+logger = logging.getLogger("act.demo")
+
+REGISTRATION_TIMEOUT = 8  # seconds TaskCreator waits for the agents before creating tasks anyway
+TASK_ACK_TIMEOUT = 10  # seconds TaskCreator waits for the server to acknowledge each task
+
+# OpenRouter requests from every agent in the process share one limit, spaced MIN_API_INTERVAL apart
+MIN_API_INTERVAL = 3  # seconds
+_OPENROUTER_BUCKET = asyncio.Semaphore(1)
+_next_slot = 0.0
+
+async def wait_for_api_slot():
+    """Wait until the shared rate limit allows another OpenRouter request"""
+    global _next_slot
+    async with _OPENROUTER_BUCKET:
+        loop = asyncio.get_running_loop()
+        wait = _next_slot - loop.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        _next_slot = loop.time() + MIN_API_INTERVAL
+
+def clip_message(message: str) -> str:
+    """Cap a status message at 240 characters
+
+    Messages are built in-process from already stripped API replies, so they are not stripped again.
+    """
+    return message if len(message) <= 240 else message[:237] + "..."
+
+# One keep-alive HTTP session for the whole process, shared by every agent's OpenRouter calls
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_session() -> aiohttp.ClientSession:
+    """Lazily create the process-wide OpenRouter session"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return _http_session
+
+async def close_session():
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+
+# Seconds agents get to disconnect after a stop before they are cancelled
+SHUTDOWN_TIMEOUT = 1.0
+
 class WorkingAIAgent:
     def __init__(self, agent_id: str, name: str, capabilities: List[str], model: str, personality: str, color: str = "🤖"):
         self.agent_id = agent_id
@@ -27,82 +78,94 @@ class WorkingAIAgent:
         self.model = model
         self.personality = personality
         self.color = color
-        self.sio = socketio.AsyncClient()
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
         self.tasks_completed = 0
-        self.is_running = True
+        self._stop_event = asyncio.Event()
         self.is_registered = False
         self.api_key = os.getenv('OPENROUTER_API_KEY')
 
-        # Rate limiting
-        self.last_api_call = 0
-        self.min_api_interval = 3  # 3 seconds between API calls
-        self.request_queue = asyncio.Queue()
-        self.setup_event_handlers()
+        # Parts of every OpenRouter request that never change for this agent
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._system_message = {"role": "system", "content": f"You are {self.name}. {self.personality} Be concise and practical."}
+        # Request body up to the user message content, encoded once; each call appends the prompt and max_tokens
+        self._body_prefix = orjson.dumps({
+            "model": self.model,
+            "temperature": 0.7,
+            "messages": [self._system_message]
+        })[:-2] + b',{"role":"user","content":'
+
+        self.sio.on('connect', self._on_connect)
+        self.sio.on('agent_registered', self._on_agent_registered)
+        self.sio.on('task_assigned', self.handle_task_assignment)
+        self.sio.on('task_created', self._on_task_created)
+        self.sio.on('agent_message', self._on_agent_message)
 
     def log_conversation(self, sender: str, message: str, timestamp: Optional[str] = None):
         """Emit a formatted log line for agent-to-agent conversation"""
-        ts = timestamp or datetime.now().isoformat(timespec='seconds')
+        ts = timestamp or iso_timestamp_seconds()
 
         if sender == self.name:
-            print(f"📣 [{ts}] {self.name} broadcast: {message}")
+            logger.info(f"📣 [{ts}] {self.name} broadcast: {message}")
         else:
-            print(f"💬 [{ts}] {self.name} heard {sender}: {message}")
+            logger.info(f"💬 [{ts}] {self.name} heard {sender}: {message}")
 
     async def broadcast_status(self, message: str):
         """Send agent status updates over the conversation channel and log locally"""
         if not message:
             return
 
-        clean_message = message.strip()
-        if len(clean_message) > 240:
-            clean_message = f"{clean_message[:237]}..."
-
         payload = {
             'sender': self.name,
-            'message': clean_message,
-            'timestamp': datetime.now().isoformat(timespec='seconds')
+            'message': clip_message(message),
+            'timestamp': iso_timestamp_seconds()
         }
 
         await self.sio.emit('agent_message', payload)
         self.log_conversation(payload['sender'], payload['message'], payload['timestamp'])
 
-    def setup_event_handlers(self):
-        @self.sio.event
-        async def connect():
-            if not self.is_registered:
-                print(f"✅ {self.name} ({self.model}) connected!")
-                await self.register_agent()
-                self.is_registered = True
+    async def _emit_phase(self, task_id: str, progress: int, status: str, message: str):
+        """Report task progress and the matching status message in a single task_update event
 
-        @self.sio.event
-        async def agent_registered(data):
-            if not self.is_registered:
-                print(f"🎯 {self.name} registered successfully")
-                self.is_registered = True
+        The server records the progress and relays the message to the other agents as agent_message.
+        """
+        payload = {
+            'taskId': task_id,
+            'progress': progress,
+            'agentId': self.agent_id,
+            'status': status,
+            'sender': self.name,
+            'message': clip_message(message),
+            'timestamp': iso_timestamp_seconds()
+        }
 
-        @self.sio.event
-        async def task_assigned(data):
-            await self.handle_task_assignment(data)
+        await self.sio.emit('task_update', payload)
+        self.log_conversation(payload['sender'], payload['message'], payload['timestamp'])
 
-        @self.sio.event
-        async def task_created(data):
-            task_desc = data.get('task', {}).get('description', 'Unknown')
-            print(f"📝 {self.name} sees new task: {task_desc[:60]}...")
+    async def _on_connect(self):
+        if not self.is_registered:
+            logger.info(f"✅ {self.name} ({self.model}) connected!")
+            await self.register_agent()
+            self.is_registered = True
 
-        @self.sio.event
-        async def agent_message(data):
-            message = data.get('message')
-            if not message:
-                return
+    async def _on_agent_registered(self, data):
+        if not self.is_registered:
+            logger.info(f"🎯 {self.name} registered successfully")
+            self.is_registered = True
 
-            sender = data.get('sender', 'Unknown')
+    async def _on_task_created(self, data):
+        task_desc = data.get('task', {}).get('description', 'Unknown')
+        logger.info(f"📝 {self.name} sees new task: {task_desc[:60]}...")
 
-            # Skip echo if server replays our own message (already logged on send)
-            if sender == self.name:
-                return
+    async def _on_agent_message(self, data):
+        message = data.get('message')
+        if not message:
+            return
 
-            timestamp = data.get('timestamp')
-            self.log_conversation(sender, message, timestamp)
+        # The server relays agent_message to every socket except the sender's, so this is never our own
+        self.log_conversation(data.get('sender', 'Unknown'), message, data.get('timestamp'))
 
     async def register_agent(self):
         """Register once only"""
@@ -118,56 +181,35 @@ class WorkingAIAgent:
     async def rate_limited_api_call(self, prompt: str, max_tokens: int = 150) -> str:
         """API call with proper rate limiting and error handling"""
 
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_call
-        if time_since_last < self.min_api_interval:
-            wait_time = self.min_api_interval - time_since_last
-            await asyncio.sleep(wait_time)
+        # Rate limiting, shared with every other agent in the process
+        await wait_for_api_slot()
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        data = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": f"You are {self.name}. {self.personality} Be concise and practical."},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": max_tokens,
-            "temperature": 0.7
-        }
+        body = self._body_prefix + orjson.dumps(prompt) + b'}],"max_tokens":%d}' % max_tokens
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    self.last_api_call = time.time()
-
-                    if response.status == 200:
-                        result = await response.json()
-                        return result["choices"][0]["message"]["content"].strip()
-                    elif response.status == 429:  # Rate limited
-                        print(f"⏳ {self.name} hit rate limit, using fallback response")
-                        return f"[{self.name} processing - rate limited but working on task]"
-                    elif response.status == 404:  # Model not available
-                        print(f"❌ {self.name} model not available, using capability-based response")
-                        return f"[{self.name} using built-in {self.capabilities[0]} expertise]"
-                    else:
-                        print(f"⚠️ {self.name} API error {response.status}, using fallback")
-                        return f"[{self.name} working with offline capabilities]"
+            async with get_session().post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers=self._headers,
+                data=body
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    return result["choices"][0]["message"]["content"].strip()
+                elif response.status == 429:  # Rate limited
+                    logger.info(f"⏳ {self.name} hit rate limit, using fallback response")
+                    return f"[{self.name} processing - rate limited but working on task]"
+                elif response.status == 404:  # Model not available
+                    logger.info(f"❌ {self.name} model not available, using capability-based response")
+                    return f"[{self.name} using built-in {self.capabilities[0]} expertise]"
+                else:
+                    logger.info(f"⚠️ {self.name} API error {response.status}, using fallback")
+                    return f"[{self.name} working with offline capabilities]"
 
         except asyncio.TimeoutError:
-            print(f"⏱️ {self.name} API timeout, using fallback")
+            logger.info(f"⏱️ {self.name} API timeout, using fallback")
             return f"[{self.name} processing with local expertise]"
         except Exception as e:
-            print(f"🔧 {self.name} API error, using fallback: {str(e)[:50]}")
+            logger.info(f"🔧 {self.name} API error, using fallback: {str(e)[:50]}")
             return f"[{self.name} working with {self.capabilities[0]} capabilities]"
 
     async def handle_task_assignment(self, data):
@@ -179,115 +221,95 @@ class WorkingAIAgent:
         task_id = task.get('id')
         description = task.get('description')
 
-        print(f"\n{self.color} {self.name} ASSIGNED TASK: {description}")
-        print(f"📋 Task ID: {task_id}")
+        logger.info(f"\n{self.color} {self.name} ASSIGNED TASK: {description}")
+        logger.info(f"📋 Task ID: {task_id}")
         await self.broadcast_status(f"Starting work on: {description}")
 
+        calls = []
+        updates = []
         try:
+            # All four phases are requested at once (they only depend on the task description);
+            # results are still reported in phase order as each one comes back
+            phase_prompts = (
+                (f'Task: "{description}"\n\nAs a {self.capabilities[0]} expert, provide a 1-sentence analysis of this task.', 100),
+                (f'For task "{description}", provide a brief 1-sentence work plan.', 100),
+                (f'Briefly describe what you would implement for: "{description}"', 120),
+                (f'Summarize what you completed for task: "{description}" (1 sentence)', 100)
+            )
+            calls = [asyncio.create_task(self.rate_limited_api_call(prompt, max_tokens)) for prompt, max_tokens in phase_prompts]
+
             # Phase 1: Analysis
-            print(f"🔍 {self.name} analyzing task...")
-            analysis_prompt = f'Task: "{description}"\n\nAs a {self.capabilities[0]} expert, provide a 1-sentence analysis of this task.'
-
-            analysis = await self.rate_limited_api_call(analysis_prompt, 100)
-            print(f"💭 {self.name}: {analysis}")
-            await self.broadcast_status(f"Analysis complete: {analysis}")
-
-            await self.sio.emit('update_task_progress', {
-                'taskId': task_id,
-                'progress': 25,
-                'agentId': self.agent_id,
-                'status': 'Analysis complete'
-            })
+            logger.info(f"🔍 {self.name} analyzing task...")
+            analysis = await calls[0]
+            logger.info(f"💭 {self.name}: {analysis}")
+
+            # The phase update runs as a task and is only awaited alongside the next phase
+            update = asyncio.create_task(self._emit_phase(task_id, 25, 'Analysis complete', f"Analysis complete: {analysis}"))
+            updates.append(update)
 
             # Phase 2: Planning
-            await asyncio.sleep(2)
-            print(f"📋 {self.name} creating work plan...")
-            plan_prompt = f'For task "{description}", provide a brief 1-sentence work plan.'
-
-            plan = await self.rate_limited_api_call(plan_prompt, 100)
-            print(f"📝 {self.name}: {plan}")
-            await self.broadcast_status(f"Work plan ready: {plan}")
-
-            await self.sio.emit('update_task_progress', {
-                'taskId': task_id,
-                'progress': 50,
-                'agentId': self.agent_id,
-                'status': 'Planning complete'
-            })
+            logger.info(f"📋 {self.name} creating work plan...")
+            plan, _ = await asyncio.gather(calls[1], update)
+            logger.info(f"📝 {self.name}: {plan}")
 
-            # Phase 3: Implementation
-            await asyncio.sleep(3)
-            print(f"⚡ {self.name} implementing solution...")
-            impl_prompt = f'Briefly describe what you would implement for: "{description}"'
-
-            implementation = await self.rate_limited_api_call(impl_prompt, 120)
-            print(f"🔧 {self.name}: {implementation}")
-            await self.broadcast_status(f"Implementation update: {implementation}")
-
-            await self.sio.emit('update_task_progress', {
-                'taskId': task_id,
-                'progress': 75,
-                'agentId': self.agent_id,
-                'status': 'Implementation in progress'
-            })
+            update = asyncio.create_task(self._emit_phase(task_id, 50, 'Planning complete', f"Work plan ready: {plan}"))
+            updates.append(update)
 
-            # Phase 4: Completion
-            await asyncio.sleep(2)
-            print(f"🎯 {self.name} finalizing work...")
-            completion_prompt = f'Summarize what you completed for task: "{description}" (1 sentence)'
+            # Phase 3: Implementation
+            logger.info(f"⚡ {self.name} implementing solution...")
+            implementation, _ = await asyncio.gather(calls[2], update)
+            logger.info(f"🔧 {self.name}: {implementation}")
 
-            completion = await self.rate_limited_api_call(completion_prompt, 100)
+            update = asyncio.create_task(
+                self._emit_phase(task_id, 75, 'Implementation in progress', f"Implementation update: {implementation}")
+            )
+            updates.append(update)
 
-            await self.sio.emit('update_task_progress', {
-                'taskId': task_id,
-                'progress': 100,
-                'agentId': self.agent_id,
-                'status': 'Task completed'
-            })
+            # Phase 4: Completion
+            logger.info(f"🎯 {self.name} finalizing work...")
+            completion, _ = await asyncio.gather(calls[3], update)
 
             self.tasks_completed += 1
-            print(f"✅ {self.name} COMPLETED TASK!")
-            print(f"🎉 Result: {completion}")
-            print(f"📊 Total tasks completed: {self.tasks_completed}")
-            await self.broadcast_status(f"Task completed! {completion}")
+            logger.info(f"✅ {self.name} COMPLETED TASK!")
+            logger.info(f"🎉 Result: {completion}")
+            logger.info(f"📊 Total tasks completed: {self.tasks_completed}")
+            await self._emit_phase(task_id, 100, 'Task completed', f"Task completed! {completion}")
 
         except Exception as e:
-            print(f"❌ {self.name} task error: {str(e)[:50]}... Reporting failure")
-            try:
-                await self.broadcast_status(f"Task failed: {str(e)[:120]}")
-            except Exception:
-                pass
-            await self.sio.emit('update_task_progress', {
-                'taskId': task_id,
-                'progress': 0,
-                'agentId': self.agent_id,
-                'status': f'Task failed: {str(e)[:30]}'
-            })
+            for pending in (*calls, *updates):
+                pending.cancel()
+            logger.info(f"❌ {self.name} task error: {str(e)[:50]}... Reporting failure")
+            await self._emit_phase(task_id, 0, f'Task failed: {str(e)[:30]}', f"Task failed: {str(e)[:120]}")
 
     async def start(self):
         """Start the agent with proper error handling"""
-        print(f"{self.color} {self.name} initializing...")
+        logger.info(f"{self.color} {self.name} initializing...")
 
         try:
-            await self.sio.connect('http://localhost:8080')
-            print(f"🧠 {self.name} ready for coordination!")
+            await self.sio.connect('http://localhost:8080', transports=['websocket'])
+            logger.info(f"🧠 {self.name} ready for coordination!")
 
-            while self.is_running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
 
         except Exception as e:
-            print(f"❌ {self.name} connection error: {e}")
+            logger.info(f"❌ {self.name} connection error: {e}")
         finally:
             await self.sio.disconnect()
 
-    async def stop(self):
-        self.is_running = False
+    def stop(self):
+        """Ask start() to disconnect; a plain call, so it can be made from signal callbacks"""
+        self._stop_event.set()
 
 class TaskCreator:
-    """Creates realistic tasks with proper spacing"""
-
-    def __init__(self):
-        self.sio = socketio.AsyncClient()
+    """Creates realistic tasks once the agents have registered, one per server acknowledgement"""
+
+    def __init__(self, agent_ids: List[str]):
+        self.sio = socketio.AsyncClient(json=OrjsonModule)
+        self._waiting_for = set(agent_ids)
+        self._agents_ready = asyncio.Event()
+        if not self._waiting_for:
+            self._agents_ready.set()
+        self._task_ack = asyncio.Event()
         self.tasks = [
             ("Create a user dashboard wireframe", ["design", "frontend"]),
             ("Write API documentation for user endpoints", ["documentation", "backend"]),
@@ -295,37 +317,67 @@ class TaskCreator:
             ("Design a mobile-friendly navigation", ["design", "mobile"])
         ]
 
+        self.sio.on('agent_joined', self._on_agent_joined)
+        self.sio.on('task_created', self._on_task_created)
+        self.sio.on('task_error', self._on_task_error)
+
+    async def _on_agent_joined(self, data):
+        self._waiting_for.discard(data.get('agentId'))
+        if not self._waiting_for:
+            self._agents_ready.set()
+
+    async def _on_task_created(self, data):
+        self._task_ack.set()
+
+    async def _on_task_error(self, data):
+        logger.info(f"❌ Task creation failed: {data.get('error')}")
+        self._task_ack.set()
+
+    async def connect(self):
+        """Connect before the agents start, so none of their agent_joined broadcasts are missed
+
+        The server's registry is not used for this: it keeps agents from earlier runs after they disconnect.
+        """
+        await self.sio.connect('http://localhost:8080', transports=['websocket'])
+
     async def create_tasks(self):
-        await self.sio.connect('http://localhost:8080')
-        await asyncio.sleep(8)  # Let agents register properly
+        try:
+            await asyncio.wait_for(self._agents_ready.wait(), REGISTRATION_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.info(f"⏳ Still waiting on {', '.join(sorted(self._waiting_for))}, creating tasks anyway")
 
-        print("\\n📋 CREATING REALISTIC TASKS")
-        print("=" * 50)
+        logger.info("\\n📋 CREATING REALISTIC TASKS")
+        logger.info("=" * 50)
 
         for i, (description, capabilities) in enumerate(self.tasks):
-            await asyncio.sleep(15)  # Proper spacing between tasks
-
+            # The next task goes out as soon as the server has taken this one
+            self._task_ack.clear()
             await self.sio.emit('create_task', {
                 'description': description,
                 'requiredCapabilities': capabilities,
                 'priority': 'medium'
             })
+            try:
+                await asyncio.wait_for(self._task_ack.wait(), TASK_ACK_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.info(f"⏳ No acknowledgement for task {i+1}/4, skipping: {description}")
+                continue
 
-            print(f"📝 Created task {i+1}/4: {description}")
-            print(f"🎯 Required capabilities: {capabilities}")
+            logger.info(f"📝 Created task {i+1}/4: {description}")
+            logger.info(f"🎯 Required capabilities: {capabilities}")
 
-        print("\\n🎉 All tasks created! Watch agents coordinate...")
+        logger.info("\\n🎉 All tasks created! Watch agents coordinate...")
         await self.sio.disconnect()
 
 async def main():
-    print("🚀 WORKING AI AGENT COORDINATION DEMO")
-    print("=" * 60)
-    print("🧠 Real AI agents with proper error handling")
-    print("⚡ Actual task assignment and completion")
-    print("🔥 Press Ctrl+C to stop\\n")
+    logger.info("🚀 WORKING AI AGENT COORDINATION DEMO")
+    logger.info("=" * 60)
+    logger.info("🧠 Real AI agents with proper error handling")
+    logger.info("⚡ Actual task assignment and completion")
+    logger.info("🔥 Press Ctrl+C to stop\\n")
 
     if not os.getenv('OPENROUTER_API_KEY'):
-        print("❌ Please set OPENROUTER_API_KEY environment variable")
+        logger.info("❌ Please set OPENROUTER_API_KEY environment variable")
         return
 
     # Create 2 working AI agents
@@ -344,38 +396,60 @@ async def main():
         )
     ]
 
-    task_creator = TaskCreator()
+    task_creator = TaskCreator([agent.agent_id for agent in agents])
+
+    def stop_all():
+        logger.info("\\n\\n🛑 Stopping coordination...")
+        task_generation.cancel()
+        for agent in agents:
+            agent.stop()
+        asyncio.get_running_loop().call_later(SHUTDOWN_TIMEOUT, cancel_laggards)
+
+    def cancel_laggards():
+        for task in agent_tasks:
+            task.cancel()  # no-op for agents that already finished
 
     try:
-        print("🔗 Starting working AI agents...")
+        await task_creator.connect()
+        logger.info("🔗 Starting working AI agents...")
 
-        # Start agents
-        agent_tasks = [asyncio.create_task(agent.start()) for agent in agents]
+        # The group waits for every child, and cancels the rest if one fails or main is interrupted
+        async with asyncio.TaskGroup() as tg:
+            # Start agents
+            agent_tasks = [tg.create_task(agent.start()) for agent in agents]
 
-        # Create tasks with proper timing
-        task_generation = asyncio.create_task(task_creator.create_tasks())
+            # Create tasks with proper timing
+            task_generation = tg.create_task(task_creator.create_tasks())
 
-        # Run coordination
-        await asyncio.gather(*agent_tasks, task_generation)
+            # Ctrl+C wakes every agent at once instead of interrupting the loop
+            stop_on_sigint(stop_all)
 
+    except Exception as e:
+        logger.info(f"❌ Coordination error: {e}")
     except KeyboardInterrupt:
-        print("\\n\\n🛑 Stopping coordination...")
-
-        for agent in agents:
-            await agent.stop()
+        logger.info("\\n\\n🛑 Stopping coordination...")
 
-        print("\\n🎯 WORKING AI COORDINATION RESULTS:")
-        print("=" * 50)
-        total_completed = 0
         for agent in agents:
-            print(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
-            total_completed += agent.tasks_completed
-
-        if total_completed > 0:
-            print(f"\\n🎉 SUCCESS: {total_completed} tasks completed through autonomous coordination!")
-            print("💡 Real AI agents coordinated, planned, and delivered results!")
-        else:
-            print("\\n📝 Agents connected but didn't complete tasks - check API access")
+            agent.stop()
+    finally:
+        await close_session()
+
+    logger.info("\\n🎯 WORKING AI COORDINATION RESULTS:")
+    logger.info("=" * 50)
+    total_completed = 0
+    for agent in agents:
+        logger.info(f"  {agent.color} {agent.name}: {agent.tasks_completed} tasks completed")
+        total_completed += agent.tasks_completed
+
+    if total_completed > 0:
+        logger.info(f"\\n🎉 SUCCESS: {total_completed} tasks completed through autonomous coordination!")
+        logger.info("💡 Real AI agents coordinated, planned, and delivered results!")
+    else:
+        logger.info("\\n📝 Agents connected but didn't complete tasks - check API access")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    log_listener = setup_logging(logger)
+    try:
+        run(main())
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -158,6 +158,34 @@ io.on('connection', (socket) => {
     }
   });
 
+  // Task progress plus the agent's status message in one event
+  socket.on('task_update', async (data) => {
+    try {
+      const { taskId, progress, status, message, agentId, sender, timestamp } = data;
+      await taskCoordinator.updateTaskProgress(taskId, { progress, status, message });
+
+      io.emit('task_progress', {
+        taskId,
+        progress,
+        status: status || `${progress}% complete`,
+        message,
+        timestamp: new Date().toISOString()
+      });
+
+      if (message) {
+        socket.broadcast.emit('agent_message', {
+          sender,
+          message,
+          timestamp: timestamp || new Date().toISOString()
+        });
+      }
+
+      logger.info(`Task ${taskId} update from ${agentId}: ${progress}%${status ? ' - ' + status : ''}`);
+    } catch (error: any) {
+      logger.error(`Task update failed: ${error.message}`);
+    }
+  });
+
   // Agent-to-agent messaging
   socket.on('agent_message', async (data) => {
     try {